@@ -2,5 +2,6 @@
 
 from .command import router as command_router
 from .state import router as state_router
+from .share import router as share_router
 
-__all__ = ['command_router', 'state_router']
+__all__ = ['command_router', 'state_router', 'share_router']
@@ -7,14 +7,19 @@ Implements Requirements 11.3, 11.4: Error handling and retry logic
 """
 
 import os
-import json
-from typing import AsyncGenerator
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+import asyncio
+from contextlib import aclosing
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Iterator, Tuple
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from strands import Agent
-from strands.models import BedrockModel
 
+from backend.services.bedrock import get_bedrock_model
 from backend.services.command_processor import CommandProcessor
 from backend.models.game_state import GameState, LocationData, Item, Decision
 from backend.utils.error_handling import (
@@ -23,11 +28,109 @@ from backend.utils.error_handling import (
     StateValidationError,
     retry_with_backoff,
     RetryConfig,
+    calculate_backoff_delay,
     format_error_response,
     logger
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Pre-encoded SSE framing so the streaming loops only encode the dynamic part
+_PREFIX = b"data: "
+_SUFFIX = b"\n\n"
+_TEXT_HEAD = b'data: {"type":"text","content":'
+_TOOL_HEAD = b'data: {"type":"tool","tool_name":'
+_DONE_HEAD = b'data: {"type":"done","result":'
+_FRAME_TAIL = b"}\n\n"
+
+# State frames larger than this are sent as several data lines of one event
+_SEGMENT_BYTES = 16 * 1024
+
+
+# Static rules first so the system prompt is identical across commands and
+# can be served from Bedrock's prompt cache; the per-player context travels
+# with the user message instead.
+_SYSTEM_PROMPT = """You are the game master for Nature42, an AI-powered text adventure game.
+
+YOUR ROLE:
+You narrate the game world, respond to player commands, and guide them through their quest to collect six keys from six different worlds. Maintain a mysterious yet humorous tone with pop culture references from 1970s-2025.
+
+GAME RULES:
+1. The game starts in a forest clearing with six numbered doors and a central vault
+2. Each door leads to a unique fantasy world where a key can be found
+3. Players must solve puzzles and interact with the world to find each key
+4. The vault opens when all six keys are collected, revealing a philosophical message
+
+RESPONSE STYLE:
+- Be descriptive and immersive
+- Include subtle pop culture references
+- Maintain age-appropriate content (13+)
+- Respond naturally to player commands
+- Provide helpful feedback for unclear commands
+
+Each player message starts with the current GAME CONTEXT followed by the player's command.
+Process the player's command and respond accordingly."""
+
+_GAME_CONTEXT_TMPL = """GAME CONTEXT:
+- Player location: {player_location}
+- Keys collected: {key_count}/6
+- Current door world: {current_door}"""
+
+# Caps concurrent model calls so bursts queue here instead of hitting
+# Bedrock throttling and the retry paths behind it
+_LLM_SEM = asyncio.Semaphore(int(os.getenv("NATURE42_MAX_CONCURRENT_LLM", "8")))
+
+# Retry policy for opening the agent stream (before anything reaches the client)
+_STREAM_RETRY = RetryConfig(max_attempts=3, initial_delay=1.0)
+
+
+def _sse(payload: dict) -> bytes:
+    """Encode a dict as a single Server-Sent Events frame."""
+    return _PREFIX + orjson.dumps(payload) + _SUFFIX
+
+
+def _json_pieces(value: Any, depth: int) -> Iterator[bytes]:
+    """
+    Encode value as JSON in pieces, splitting objects up to the given depth.
+    
+    Pieces only break between tokens, so joining them with newlines (as
+    SSE clients do for multi-line data) still yields valid JSON.
+    """
+    if depth and isinstance(value, dict) and value:
+        separator = b"{"
+        for key, item in value.items():
+            yield separator + orjson.dumps(key) + b":"
+            yield from _json_pieces(item, depth - 1)
+            separator = b","
+        yield b"}"
+    else:
+        yield orjson.dumps(value)
+
+
+def _sse_segments(payload: dict) -> Iterator[bytes]:
+    """
+    Encode a dict as one Server-Sent Events frame split over data lines.
+    
+    Each yielded line holds roughly _SEGMENT_BYTES of JSON so large state
+    frames are written progressively; small payloads produce a single line
+    identical to _sse().
+    """
+    segment = bytearray()
+    for piece in _json_pieces(payload, 3):
+        segment += piece
+        if len(segment) >= _SEGMENT_BYTES:
+            yield _PREFIX + segment + b"\n"
+            segment = bytearray()
+    yield _PREFIX + segment + _SUFFIX
+
+
+@lru_cache(maxsize=1)
+def _model_settings() -> Tuple[float, int]:
+    """Read the narration temperature and token limit from the environment once per process."""
+    return (
+        float(os.getenv("STRANDS_TEMPERATURE", "0.7")),
+        int(os.getenv("STRANDS_MAX_TOKENS", "4096")),
+    )
 
 
 class CommandRequest(BaseModel):
@@ -36,7 +139,7 @@ class CommandRequest(BaseModel):
     game_state: dict
 
 
-async def generate_response(command: str, game_state: dict) -> AsyncGenerator[str, None]:
+async def generate_response(command: str, game_state: dict) -> AsyncGenerator[bytes, None]:
     """
     Generate streaming response for a player command.
     
@@ -47,120 +150,110 @@ async def generate_response(command: str, game_state: dict) -> AsyncGenerator[st
         game_state: Current game state as dictionary
         
     Yields:
-        Server-Sent Events formatted strings
+        Server-Sent Events frames as bytes
     """
     try:
-        # Get model configuration from environment
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        temperature = float(os.getenv("STRANDS_TEMPERATURE", "0.7"))
-        max_tokens = int(os.getenv("STRANDS_MAX_TOKENS", "4096"))
-        
-        # Create Bedrock model with retry logic
-        @retry_with_backoff(
-            config=RetryConfig(max_attempts=3, initial_delay=1.0),
-            exceptions=(Exception,)
-        )
-        async def create_model():
-            try:
-                return BedrockModel(
-                    model_id=model_id,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-            except Exception as e:
-                logger.error(f"Failed to create Bedrock model: {e}")
-                raise StrandsUnavailableError(
-                    "Unable to connect to AI service",
-                    details={"error": str(e)}
-                )
-        
-        model = await create_model()
+        try:
+            model = get_bedrock_model(*_model_settings(), cache_prompt=True)
+        except Exception as e:
+            logger.error(f"Failed to create Bedrock model: {e}")
+            raise StrandsUnavailableError(
+                "Unable to connect to AI service",
+                details={"error": str(e)}
+            )
         
         # Build system prompt with game context
-        system_prompt = build_system_prompt(game_state)
-        
-        # Create agent
-        agent = Agent(
-            model=model,
-            system_prompt=system_prompt,
-            callback_handler=None  # Required for stream_async
-        )
+        system_prompt, game_context = build_system_prompt(game_state)
+        prompt = f"{game_context}\n\n{command}"
         
         # Stream agent response with error handling
+        attempt = 0
+        started = False
         try:
-            async for event in agent.stream_async(command):
-                # Send text chunks to client
-                if "data" in event:
-                    yield f"data: {json.dumps({'type': 'text', 'content': event['data']})}\n\n"
-                
-                # Send tool usage events
-                if "current_tool_use" in event:
-                    tool_name = event["current_tool_use"].get("name")
-                    if tool_name:
-                        yield f"data: {json.dumps({'type': 'tool', 'tool_name': tool_name})}\n\n"
-                
-                # Send final result
-                if "result" in event:
-                    yield f"data: {json.dumps({'type': 'done', 'result': event['result']})}\n\n"
+            async with _LLM_SEM:
+                while True:
+                    # A fresh agent per attempt so a failed attempt leaves no
+                    # half-finished turn in the conversation
+                    agent = Agent(
+                        model=model,
+                        system_prompt=system_prompt,
+                        callback_handler=None  # Required for stream_async
+                    )
+                    try:
+                        async with aclosing(agent.stream_async(prompt)) as events:
+                            async for event in events:
+                                started = True
+                                
+                                # Send text chunks to client
+                                if "data" in event:
+                                    yield _TEXT_HEAD + orjson.dumps(event["data"]) + _FRAME_TAIL
+                                
+                                # Send tool usage events
+                                if "current_tool_use" in event:
+                                    tool_name = event["current_tool_use"].get("name")
+                                    if tool_name:
+                                        yield _TOOL_HEAD + orjson.dumps(tool_name) + _FRAME_TAIL
+                                
+                                # Send final result
+                                if "result" in event:
+                                    yield _DONE_HEAD + orjson.dumps(str(event["result"])) + _FRAME_TAIL
+                        break
+                    except Exception as e:
+                        # Retry opening the stream, but never once output was sent
+                        attempt += 1
+                        if started or attempt >= _STREAM_RETRY.max_attempts:
+                            raise
+                        delay = calculate_backoff_delay(attempt - 1, _STREAM_RETRY)
+                        logger.warning(
+                            f"Agent stream failed (attempt {attempt}/{_STREAM_RETRY.max_attempts}): {e}. "
+                            f"Retrying in {delay:.2f}s..."
+                        )
+                        await asyncio.sleep(delay)
         
         except Exception as stream_error:
             logger.error(f"Error during streaming: {stream_error}")
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Connection interrupted. Please try again.'})}\n\n"
+            yield _sse({'type': 'error', 'message': 'Connection interrupted. Please try again.'})
                 
     except StrandsUnavailableError as e:
         logger.error(f"Strands unavailable: {e.message}")
         error_response = format_error_response(e, user_friendly=True)
-        yield f"data: {json.dumps({'type': 'error', 'message': error_response['message']})}\n\n"
+        yield _sse({'type': 'error', 'message': error_response['message']})
     
     except Exception as e:
         logger.error(f"Unexpected error in generate_response: {e}", exc_info=True)
-        yield f"data: {json.dumps({'type': 'error', 'message': 'An unexpected error occurred. Please try again.'})}\n\n"
+        yield _sse({'type': 'error', 'message': 'An unexpected error occurred. Please try again.'})
 
 
-def build_system_prompt(game_state: dict) -> str:
+def build_system_prompt(game_state: dict) -> Tuple[str, str]:
     """
-    Build system prompt with game context.
+    Build system prompt and game context for the agent.
+    
+    The system prompt is static so it forms a cacheable prefix; the game
+    context changes per command and is sent ahead of the player's command.
     
     Args:
         game_state: Current game state
         
     Returns:
-        System prompt string
+        Tuple of (system prompt, game context message)
     """
-    player_location = game_state.get("player_location", "unknown")
-    keys_collected = game_state.get("keys_collected", [])
-    current_door = game_state.get("current_door")
-    
-    prompt = f"""You are the game master for Nature42, an AI-powered text adventure game.
-
-GAME CONTEXT:
-- Player location: {player_location}
-- Keys collected: {len(keys_collected)}/6
-- Current door world: {current_door if current_door else "Forest Clearing (hub)"}
-
-YOUR ROLE:
-You narrate the game world, respond to player commands, and guide them through their quest to collect six keys from six different worlds. Maintain a mysterious yet humorous tone with pop culture references from 1970s-2025.
-
-GAME RULES:
-1. The game starts in a forest clearing with six numbered doors and a central vault
-2. Each door leads to a unique fantasy world where a key can be found
-3. Players must solve puzzles and interact with the world to find each key
-4. The vault opens when all six keys are collected, revealing a philosophical message
+    return _SYSTEM_PROMPT, _GAME_CONTEXT_TMPL.format_map({
+        "player_location": game_state.get("player_location", "unknown"),
+        "key_count": len(game_state.get("keys_collected", [])),
+        "current_door": game_state.get("current_door") or "Forest Clearing (hub)",
+    })
 
-RESPONSE STYLE:
-- Be descriptive and immersive
-- Include subtle pop culture references
-- Maintain age-appropriate content (13+)
-- Respond naturally to player commands
-- Provide helpful feedback for unclear commands
 
-Process the player's command and respond accordingly."""
-    
-    return prompt
-
-
-@router.post("/api/command")
-async def process_command(request: CommandRequest):
+@router.post(
+    "/api/command",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": CommandRequest.model_json_schema()}}
+        }
+    }
+)
+async def process_command(request: Request, full: bool = False):
     """
     Process a player command with streaming response.
     
@@ -178,24 +271,47 @@ async def process_command(request: CommandRequest):
     - new_location_generated: New location data to add to visited_locations
     
     Clients should apply these changes to their local game state and persist
-    to browser storage.
+    to browser storage. The stream carries a state_delta event with only the
+    fields a command can change (see GameState.to_delta); pass full=true to
+    receive the complete state in a state_changes event instead.
+    
+    The body (see CommandRequest) is decoded directly rather than through a
+    Pydantic model, so an empty command is rejected before the game state is
+    looked at and the game state dict goes straight to GameState.from_dict.
     
     Args:
-        request: Command request with command text and game state
+        request: Incoming request whose JSON body has command and game_state
+        full: Send the complete game state instead of a delta
         
     Returns:
         StreamingResponse with Server-Sent Events
     """
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object")
+    
+    command = body.get("command")
+    if command is not None and not isinstance(command, str):
+        raise HTTPException(status_code=422, detail="Command must be a string")
+    
     # Validate command
-    if not request.command or not request.command.strip():
+    if not command or not command.strip():
         raise HTTPException(
             status_code=400,
             detail="Command cannot be empty. Try 'help' for assistance."
         )
     
-    # Convert game_state dict to GameState object with error handling
+    raw_state = body.get("game_state")
+    if not isinstance(raw_state, dict):
+        raise HTTPException(status_code=422, detail="Game state must be a JSON object")
+    
+    # Convert game_state dict to GameState object with error handling;
+    # visited locations are parsed only when the command reads them
     try:
-        game_state = GameState.from_dict(request.game_state)
+        game_state = GameState.from_dict(raw_state, lazy_locations=True)
     except Exception as e:
         logger.error(f"Invalid game state: {e}")
         raise HTTPException(
@@ -203,9 +319,12 @@ async def process_command(request: CommandRequest):
             detail="Your game state appears to be corrupted. You may need to start a new game."
         )
     
+    known_location_ids = set(game_state.visited_locations)
+    decision_count = len(game_state.decision_history)
+    
     # Create command processor
     try:
-        processor = CommandProcessor(game_state)
+        processor = CommandProcessor(game_state, stream_text=True)
     except Exception as e:
         logger.error(f"Failed to create command processor: {e}")
         raise HTTPException(
@@ -220,12 +339,13 @@ async def process_command(request: CommandRequest):
     )
     async def process_with_retry():
         try:
-            return await processor.process_command(request.command)
+            async with _LLM_SEM:
+                return await processor.process_command(command)
         except Exception as e:
             logger.error(f"Command processing failed: {e}")
             raise CommandProcessingError(
                 "Failed to process command",
-                details={"command": request.command, "error": str(e)}
+                details={"command": command, "error": str(e)}
             )
     
     try:
@@ -255,9 +375,8 @@ async def process_command(request: CommandRequest):
             
             # Remove items from inventory
             if 'items_removed' in result.state_changes:
-                for item_dict in result.state_changes['items_removed']:
-                    item_id = item_dict.get('id')
-                    game_state.inventory = [i for i in game_state.inventory if i.id != item_id]
+                removed_ids = {item_dict.get('id') for item_dict in result.state_changes['items_removed']}
+                game_state.inventory = [i for i in game_state.inventory if i.id not in removed_ids]
             
             # Add key to keys_collected (single key - backward compatibility)
             if 'key_inserted' in result.state_changes:
@@ -278,24 +397,36 @@ async def process_command(request: CommandRequest):
                 game_state.decision_history.append(decision)
             
             # Update last_updated timestamp
-            from datetime import datetime
             game_state.last_updated = datetime.now()
         
         # Return result as streaming response
         async def generate_result():
             try:
-                # Send the message
-                yield f"data: {json.dumps({'type': 'text', 'content': result.message})}\n\n"
+                # Send the message, relaying narration as the model writes it
+                if result.message_stream is not None:
+                    async with _LLM_SEM, aclosing(result.message_stream) as message_stream:
+                        async for text in message_stream:
+                            yield _TEXT_HEAD + orjson.dumps(text) + _FRAME_TAIL
+                else:
+                    yield _TEXT_HEAD + orjson.dumps(result.message) + _FRAME_TAIL
                 
                 # Send updated game state
-                yield f"data: {json.dumps({'type': 'state_changes', 'changes': game_state.to_dict()})}\n\n"
+                if full:
+                    state_frame = {'type': 'state_changes', 'changes': game_state.to_dict()}
+                else:
+                    state_frame = {
+                        'type': 'state_delta',
+                        'changes': game_state.to_delta(known_location_ids, decision_count)
+                    }
+                for segment in _sse_segments(state_frame):
+                    yield segment
                 
                 # Send done signal
-                yield f"data: {json.dumps({'type': 'done', 'success': result.success})}\n\n"
+                yield _sse({'type': 'done', 'success': result.success})
             
             except Exception as e:
                 logger.error(f"Error generating result stream: {e}")
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Error sending response. Please try again.'})}\n\n"
+                yield _sse({'type': 'error', 'message': 'Error sending response. Please try again.'})
         
         return StreamingResponse(
             generate_result(),
@@ -0,0 +1,19 @@
+"""
+Shared fixtures for the API integration tests.
+"""
+
+import httpx
+import pytest_asyncio
+
+from backend.main import app
+
+# Request bodies are pre-encoded with orjson and sent as raw content
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Async client calling the app in-process through its ASGI interface, sending JSON."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=JSON_HEADERS) as c:
+        yield c
@@ -4,15 +4,16 @@ Sharing API endpoints for Nature42.
 Handles creation and retrieval of shareable postcards.
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import AsyncGenerator, Optional
 
 from backend.models import GameState
 from backend.services.sharing import get_sharing_service
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class CreateShareRequest(BaseModel):
@@ -28,16 +29,28 @@ class ShareResponse(BaseModel):
     postcard: Optional[dict] = None
 
 
-@router.post("/api/share")
-async def create_share(request: CreateShareRequest):
+@router.post(
+    "/api/share",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": CreateShareRequest.model_json_schema()}}
+        }
+    }
+)
+async def create_share(request: Request):
     """
     Create a shareable postcard from game state.
     
     Generates a formatted summary with location image, description,
     and keys collected count. Excludes puzzle solutions and spoilers.
     
+    The body (see CreateShareRequest) is decoded directly; the game state
+    dict is validated by GameState itself, so a Pydantic pass adds nothing.
+    
     Args:
-        request: CreateShareRequest with game state and optional location ID
+        request: Incoming request whose JSON body has game_state and an
+            optional location_id
         
     Returns:
         JSON response with shareable postcard
@@ -45,9 +58,19 @@ async def create_share(request: CreateShareRequest):
     Raises:
         HTTPException: If game state is invalid or location not found
     """
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON")
+    if not isinstance(body, dict) or not isinstance(body.get("game_state"), dict):
+        raise HTTPException(status_code=422, detail="Game state must be a JSON object")
+    location_id = body.get("location_id")
+    if location_id is not None and not isinstance(location_id, str):
+        raise HTTPException(status_code=422, detail="Location ID must be a string")
+    
     try:
         # Deserialize game state
-        game_state = GameState.from_dict(request.game_state)
+        game_state = GameState.from_dict_cached(body["game_state"])
         
         # Get sharing service
         sharing_service = get_sharing_service()
@@ -55,15 +78,16 @@ async def create_share(request: CreateShareRequest):
         # Create postcard
         postcard = sharing_service.create_postcard(
             game_state=game_state,
-            location_id=request.location_id
+            location_id=location_id
         )
         
-        return JSONResponse(
-            content={
+        return Response(
+            content=orjson.dumps({
                 "success": True,
                 "message": "Postcard created successfully",
                 "postcard": postcard.to_dict()
-            }
+            }),
+            media_type="application/json"
         )
         
     except ValueError as e:
@@ -101,12 +125,13 @@ async def get_share(share_code: str):
             detail=f"Share code '{share_code}' not found"
         )
     
-    return JSONResponse(
-        content={
+    return Response(
+        content=orjson.dumps({
             "success": True,
             "message": "Postcard retrieved successfully",
             "postcard": postcard.to_dict()
-        }
+        }),
+        media_type="application/json"
     )
 
 
@@ -119,18 +144,21 @@ async def list_shares():
         JSON response with all postcards
     """
     sharing_service = get_sharing_service()
-    shares = sharing_service.list_shares()
+    share_count = sharing_service.share_count()
+    share_chunks = sharing_service.iter_shares_json()
     
-    return JSONResponse(
-        content={
-            "success": True,
-            "message": f"Retrieved {len(shares)} shares",
-            "shares": {
-                code: postcard.to_dict()
-                for code, postcard in shares.items()
-            }
-        }
-    )
+    async def generate_body() -> AsyncGenerator[bytes, None]:
+        # Stream the service's per-share encodings inside the envelope
+        yield (
+            b'{"success":true,"message":'
+            + orjson.dumps(f"Retrieved {share_count} shares")
+            + b',"shares":'
+        )
+        for chunk in share_chunks:
+            yield chunk
+        yield b'}'
+    
+    return StreamingResponse(generate_body(), media_type="application/json")
 
 
 @router.delete("/api/share/{share_code}")
@@ -156,9 +184,10 @@ async def delete_share(share_code: str):
             detail=f"Share code '{share_code}' not found"
         )
     
-    return JSONResponse(
-        content={
+    return Response(
+        content=orjson.dumps({
             "success": True,
             "message": "Share deleted successfully"
-        }
+        }),
+        media_type="application/json"
     )
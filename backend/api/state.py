@@ -6,10 +6,13 @@ Handles game state retrieval, saving, and deletion.
 Implements Requirements 5.5, 11.4: Error handling for corrupted state
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from datetime import datetime
+from functools import lru_cache
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from backend.models import GameState
 from backend.utils.error_handling import (
@@ -18,7 +21,7 @@ from backend.utils.error_handling import (
     logger
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class StateResponse(BaseModel):
@@ -28,6 +31,41 @@ class StateResponse(BaseModel):
     state: Optional[dict] = None
 
 
+# The state endpoints take the game state dict as the whole request body
+_STATE_BODY_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": {"type": "object", "title": "State"}}}
+    }
+}
+
+
+async def _read_state_body(request: Request) -> Dict[str, Any]:
+    """
+    Decode a game state dict from the raw request body.
+    
+    GameState.from_dict validates the structure itself, so the body is
+    decoded once with orjson instead of also passing through a Pydantic
+    dict validation.
+    
+    Args:
+        request: Incoming request whose JSON body is the game state
+        
+    Returns:
+        Decoded game state dictionary
+        
+    Raises:
+        HTTPException: If the body is not a JSON object
+    """
+    try:
+        state = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON")
+    if not isinstance(state, dict):
+        raise HTTPException(status_code=422, detail="Game state must be a JSON object")
+    return state
+
+
 @router.get("/api/state")
 async def get_state():
     """
@@ -39,17 +77,18 @@ async def get_state():
     Returns:
         JSON response with state information
     """
-    return JSONResponse(
-        content={
+    return Response(
+        content=orjson.dumps({
             "success": True,
             "message": "State management is client-side. Use browser storage.",
             "note": "This endpoint is reserved for future server-side state management"
-        }
+        }),
+        media_type="application/json"
     )
 
 
-@router.post("/api/state")
-async def save_state(state: dict):
+@router.post("/api/state", openapi_extra=_STATE_BODY_OPENAPI)
+async def save_state(request: Request):
     """
     Save game state.
     
@@ -59,14 +98,16 @@ async def save_state(state: dict):
     This endpoint validates the state structure but doesn't persist it server-side.
     
     Args:
-        state: Game state dictionary
+        request: Incoming request whose JSON body is the game state
         
     Returns:
         JSON response confirming validation
     """
+    state = await _read_state_body(request)
+    
     try:
         # Validate state structure by attempting to deserialize
-        game_state = GameState.from_dict(state)
+        game_state = GameState.from_dict_cached(state)
         
         # Additional validation checks
         if not game_state.player_location:
@@ -81,12 +122,13 @@ async def save_state(state: dict):
                 details={"keys": game_state.keys_collected}
             )
         
-        return JSONResponse(
-            content={
+        return Response(
+            content=orjson.dumps({
                 "success": True,
                 "message": "State validated successfully",
                 "note": "State is managed client-side in browser storage"
-            }
+            }),
+            media_type="application/json"
         )
     
     except StateValidationError as e:
@@ -105,6 +147,26 @@ async def save_state(state: dict):
         )
 
 
+@lru_cache(maxsize=1)
+def _new_game_response_prefix() -> bytes:
+    """
+    Pre-encode the delete_state response body once per process.
+    
+    Every new game starts from the same forest clearing, so only the
+    timestamps differ between calls. The body is encoded without them and
+    the closing braces are stripped, leaving the fresh timestamps to be
+    appended as the last keys of "state".
+    """
+    template = GameState.create_new_game().to_dict()
+    del template["game_started_at"], template["last_updated"]
+    body = orjson.dumps({
+        "success": True,
+        "message": "New game state created",
+        "state": template
+    })
+    return body[:-2]
+
+
 @router.delete("/api/state")
 async def delete_state():
     """
@@ -119,14 +181,16 @@ async def delete_state():
         JSON response with new game state
     """
     try:
-        new_state = GameState.create_new_game()
+        now = orjson.dumps(datetime.now().isoformat())
         
-        return JSONResponse(
-            content={
-                "success": True,
-                "message": "New game state created",
-                "state": new_state.to_dict()
-            }
+        return Response(
+            content=b"".join((
+                _new_game_response_prefix(),
+                b',"game_started_at":', now,
+                b',"last_updated":', now,
+                b"}}"
+            )),
+            media_type="application/json"
         )
     
     except Exception as e:
@@ -137,22 +201,33 @@ async def delete_state():
         )
 
 
-@router.post("/api/state/validate")
-async def validate_state(state: dict):
+# Reply for a valid state without details; identical for every request
+_VALID_STATE_BODY = orjson.dumps({
+    "success": True,
+    "valid": True,
+    "message": "State structure is valid"
+})
+
+
+@router.post("/api/state/validate", openapi_extra=_STATE_BODY_OPENAPI)
+async def validate_state(request: Request, details: bool = False):
     """
     Validate game state structure without saving.
     
     Implements Requirement 5.5: Detect corrupted state
     
     Args:
-        state: Game state dictionary to validate
+        request: Incoming request whose JSON body is the game state to validate
+        details: Include a summary of the validated state in the response
         
     Returns:
         JSON response with validation result
     """
+    state = await _read_state_body(request)
+    
     try:
         # Attempt to deserialize to validate structure
-        game_state = GameState.from_dict(state)
+        game_state = GameState.from_dict_cached(state)
         
         # Perform additional validation
         validation_errors = []
@@ -160,25 +235,29 @@ async def validate_state(state: dict):
         if not game_state.player_location:
             validation_errors.append("Missing player location")
         
-        if game_state.keys_collected and not all(1 <= k <= 6 for k in game_state.keys_collected):
+        # Keys must be distinct door numbers, which also caps them at six
+        keys = game_state.keys_collected
+        if len(set(keys)) != len(keys) or any(k < 1 or k > 6 for k in keys):
             validation_errors.append("Invalid key numbers")
         
-        if len(game_state.keys_collected) > 6:
-            validation_errors.append("Too many keys collected")
-        
         if validation_errors:
-            return JSONResponse(
+            return Response(
                 status_code=200,
-                content={
+                content=orjson.dumps({
                     "success": True,
                     "valid": False,
                     "message": "State has validation errors",
                     "errors": validation_errors
-                }
+                }),
+                media_type="application/json"
             )
         
-        return JSONResponse(
-            content={
+        if not details:
+            return Response(content=_VALID_STATE_BODY, media_type="application/json")
+        
+        # Summary counts are read straight off the parsed state
+        return Response(
+            content=orjson.dumps({
                 "success": True,
                 "valid": True,
                 "message": "State structure is valid",
@@ -188,18 +267,20 @@ async def validate_state(state: dict):
                     "inventory_items": len(game_state.inventory),
                     "visited_locations": len(game_state.visited_locations)
                 }
-            }
+            }),
+            media_type="application/json"
         )
     
     except Exception as e:
         logger.warning(f"State validation failed: {e}")
-        return JSONResponse(
+        return Response(
             status_code=200,  # Return 200 but indicate invalid
-            content={
+            content=orjson.dumps({
                 "success": True,
                 "valid": False,
                 "message": "State structure is invalid",
                 "error": str(e),
                 "recovery_suggestion": "Start a new game to continue playing"
-            }
+            }),
+            media_type="application/json"
         )
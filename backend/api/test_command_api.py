@@ -0,0 +1,52 @@
+"""
+Integration tests for the command API endpoint.
+
+Tests that streamed narration is relayed to the client as SSE text frames.
+"""
+
+import orjson
+import pytest
+
+import backend.api.command as command_api
+from backend.models.game_state import GameState
+from backend.services.command_models import CommandResult
+
+
+
+def parse_sse(body: bytes):
+    """Decode an SSE body into its JSON payloads, joining multi-line data."""
+    events = []
+    for event in body.decode().split("\n\n"):
+        data = "\n".join(line[len("data: "):] for line in event.split("\n") if line.startswith("data: "))
+        if data:
+            events.append(orjson.loads(data))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_message_stream_relayed_as_text_frames(client, monkeypatch):
+    """Test that each narration chunk becomes its own text frame before done."""
+
+    class FakeProcessor:
+        def __init__(self, game_state, stream_text=False):
+            assert stream_text
+
+        async def process_command(self, command):
+            async def narration():
+                yield "The owl "
+                yield "blinks slowly."
+            return CommandResult(success=True, message="", message_stream=narration())
+
+    monkeypatch.setattr(command_api, "CommandProcessor", FakeProcessor)
+    body = orjson.dumps({"command": "talk to owl", "game_state": GameState.create_new_game().to_dict()})
+
+    response = await client.post("/api/command", content=body)
+
+    assert response.status_code == 200
+    events = parse_sse(response.content)
+    assert [e["content"] for e in events if e["type"] == "text"] == ["The owl ", "blinks slowly."]
+    assert events[-1] == {"type": "done", "success": True}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,14 +4,13 @@ Integration tests for sharing API endpoints.
 Tests the FastAPI endpoints for creating and retrieving shareable postcards.
 """
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 from datetime import datetime
 
-from backend.main import app
 from backend.models.game_state import GameState, LocationData
 
-client = TestClient(app)
 
 
 def create_test_game_state():
@@ -42,15 +41,31 @@ def create_test_game_state():
     return game_state
 
 
-def test_create_share_endpoint():
+@pytest.fixture(scope="module")
+def game_state_dict():
+    """Serialized test game state, built once per module."""
+    return create_test_game_state().to_dict()
+
+
+@pytest.fixture(scope="module")
+def share_body(game_state_dict):
+    """Pre-encoded POST /api/share body for the test game state."""
+    return orjson.dumps({"game_state": game_state_dict})
+
+
+@pytest_asyncio.fixture
+async def share_code(client, share_body):
+    """Create a fresh share and return its code."""
+    response = await client.post("/api/share", content=share_body)
+    return response.json()["postcard"]["share_code"]
+
+
+@pytest.mark.asyncio
+async def test_create_share_endpoint(client, share_body):
     """Test POST /api/share endpoint."""
-    game_state = create_test_game_state()
-    
-    response = client.post(
+    response = await client.post(
         "/api/share",
-        json={
-            "game_state": game_state.to_dict()
-        }
+        content=share_body
     )
     
     assert response.status_code == 200
@@ -66,22 +81,10 @@ def test_create_share_endpoint():
     assert postcard["keys_collected"] == 3
 
 
-def test_get_share_endpoint():
+@pytest.mark.asyncio
+async def test_get_share_endpoint(client, share_code):
     """Test GET /api/share/{share_code} endpoint."""
-    # First create a share
-    game_state = create_test_game_state()
-    
-    create_response = client.post(
-        "/api/share",
-        json={
-            "game_state": game_state.to_dict()
-        }
-    )
-    
-    share_code = create_response.json()["postcard"]["share_code"]
-    
-    # Now retrieve it
-    get_response = client.get(f"/api/share/{share_code}")
+    get_response = await client.get(f"/api/share/{share_code}")
     
     assert get_response.status_code == 200
     data = get_response.json()
@@ -91,18 +94,20 @@ def test_get_share_endpoint():
     assert data["postcard"]["share_code"] == share_code
 
 
-def test_get_nonexistent_share():
+@pytest.mark.asyncio
+async def test_get_nonexistent_share(client):
     """Test GET /api/share/{share_code} with invalid code."""
-    response = client.get("/api/share/INVALID123")
+    response = await client.get("/api/share/INVALID123")
     
     assert response.status_code == 404
     data = response.json()
     assert "not found" in data["message"].lower()
 
 
-def test_list_shares_endpoint():
+@pytest.mark.asyncio
+async def test_list_shares_endpoint(client):
     """Test GET /api/shares endpoint."""
-    response = client.get("/api/shares")
+    response = await client.get("/api/shares")
     
     assert response.status_code == 200
     data = response.json()
@@ -112,33 +117,23 @@ def test_list_shares_endpoint():
     assert isinstance(data["shares"], dict)
 
 
-def test_delete_share_endpoint():
+@pytest.mark.asyncio
+async def test_delete_share_endpoint(client, share_code):
     """Test DELETE /api/share/{share_code} endpoint."""
-    # First create a share
-    game_state = create_test_game_state()
-    
-    create_response = client.post(
-        "/api/share",
-        json={
-            "game_state": game_state.to_dict()
-        }
-    )
-    
-    share_code = create_response.json()["postcard"]["share_code"]
-    
     # Delete it
-    delete_response = client.delete(f"/api/share/{share_code}")
+    delete_response = await client.delete(f"/api/share/{share_code}")
     
     assert delete_response.status_code == 200
     data = delete_response.json()
     assert data["success"] is True
     
     # Verify it's gone
-    get_response = client.get(f"/api/share/{share_code}")
+    get_response = await client.get(f"/api/share/{share_code}")
     assert get_response.status_code == 404
 
 
-def test_create_share_with_specific_location():
+@pytest.mark.asyncio
+async def test_create_share_with_specific_location(client):
     """Test creating a share for a specific location."""
     location1 = LocationData(
         id="location1",
@@ -176,12 +171,12 @@ def test_create_share_with_specific_location():
         last_updated=datetime.now()
     )
     
-    response = client.post(
+    response = await client.post(
         "/api/share",
-        json={
+        content=orjson.dumps({
             "game_state": game_state.to_dict(),
             "location_id": "location2"
-        }
+        })
     )
     
     assert response.status_code == 200
@@ -192,16 +187,15 @@ def test_create_share_with_specific_location():
     assert postcard["location_description"] == "Second location"
 
 
-def test_create_share_invalid_location():
+@pytest.mark.asyncio
+async def test_create_share_invalid_location(client, game_state_dict):
     """Test creating a share for a non-existent location."""
-    game_state = create_test_game_state()
-    
-    response = client.post(
+    response = await client.post(
         "/api/share",
-        json={
-            "game_state": game_state.to_dict(),
+        content=orjson.dumps({
+            "game_state": game_state_dict,
             "location_id": "nonexistent_location"
-        }
+        })
     )
     
     assert response.status_code == 404
@@ -209,15 +203,16 @@ def test_create_share_invalid_location():
     assert "not found" in data["message"].lower()
 
 
-def test_create_share_invalid_game_state():
+@pytest.mark.asyncio
+async def test_create_share_invalid_game_state(client):
     """Test creating a share with invalid game state."""
-    response = client.post(
+    response = await client.post(
         "/api/share",
-        json={
+        content=orjson.dumps({
             "game_state": {
                 "invalid": "data"
             }
-        }
+        })
     )
     
     assert response.status_code == 400
@@ -8,20 +8,27 @@ Implements Requirements 11.3, 11.4: Comprehensive error handling
 """
 
 import os
+import time
+import asyncio
+import hashlib
 import logging
+import orjson
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from dotenv import load_dotenv
 
-from backend.api.command import router as command_router
-from backend.api.state import router as state_router
-from backend.api.share import router as share_router
+from backend.api import command_router, state_router, share_router
 from backend.utils.error_handling import (
     Nature42Error,
+    check_strands_health,
     format_error_response,
     logger
 )
@@ -33,7 +40,8 @@ load_dotenv()
 app = FastAPI(
     title="Nature42",
     description="AI-powered text adventure game",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Include routers
@@ -42,23 +50,72 @@ app.include_router(state_router)
 app.include_router(share_router)
 
 
-# Global Exception Handlers
+# Global Exception Handling
 
-@app.exception_handler(Nature42Error)
-async def nature42_error_handler(request: Request, exc: Nature42Error):
+class ErrorResponseMiddleware:
     """
-    Handle custom Nature42 errors with user-friendly messages.
+    Pure ASGI middleware turning uncaught exceptions into JSON error responses.
     
-    Implements Requirement 11.4: User-friendly error messages
+    Implements Requirement 11.4: User-friendly error messages and graceful
+    error handling
+    
+    Nature42Error and unexpected exceptions are caught here rather than
+    through exception handlers, so no handler dispatch or Request object is
+    needed on the error path. HTTPException and validation errors are
+    raised and handled inside the router and keep their handlers below.
     """
-    logger.error(f"Nature42Error in {request.url.path}: {exc.message}")
     
-    error_response = format_error_response(exc, user_friendly=True)
+    def __init__(self, app: ASGIApp):
+        self.app = app
     
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response
-    )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if response_started:
+                raise
+            
+            if isinstance(exc, Nature42Error):
+                logger.error(f"Nature42Error in {scope['path']}: {exc.message}")
+            else:
+                logger.error(
+                    f"Unexpected error in {scope['path']}: {type(exc).__name__}: {exc}",
+                    exc_info=True
+                )
+            
+            body = orjson.dumps(format_error_response(exc, user_friendly=True))
+            await send({
+                "type": "http.response.start",
+                "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1"))
+                ]
+            })
+            await send({"type": "http.response.body", "body": body})
+
+
+app.add_middleware(ErrorResponseMiddleware)
+
+
+# Fixed leading bytes of the handler bodies; only the trailing field varies
+_HTTP_ERROR_PREFIX = b'{"success":false,"error_type":"HTTPException","message":'
+_VALIDATION_ERROR_PREFIX = (
+    b'{"success":false,"error_type":"ValidationError",'
+    b'"message":"Invalid request data","details":'
+)
 
 
 @app.exception_handler(StarletteHTTPException)
@@ -68,13 +125,10 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """
     logger.warning(f"HTTP {exc.status_code} in {request.url.path}: {exc.detail}")
     
-    return JSONResponse(
+    return Response(
+        content=_HTTP_ERROR_PREFIX + orjson.dumps(exc.detail) + b"}",
         status_code=exc.status_code,
-        content={
-            "success": False,
-            "error_type": "HTTPException",
-            "message": exc.detail
-        }
+        media_type="application/json"
     )
 
 
@@ -83,72 +137,134 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     """
     Handle request validation errors with helpful messages.
     """
-    logger.warning(f"Validation error in {request.url.path}: {exc.errors()}")
+    errors = exc.errors()
+    logger.warning(f"Validation error in {request.url.path}: {errors}")
     
-    return JSONResponse(
+    return Response(
+        content=_VALIDATION_ERROR_PREFIX + orjson.dumps(errors) + b"}",
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "success": False,
-            "error_type": "ValidationError",
-            "message": "Invalid request data",
-            "details": exc.errors()
-        }
+        media_type="application/json"
     )
 
 
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception):
-    """
-    Catch-all handler for unexpected exceptions.
-    
-    Implements Requirement 11.4: Graceful error handling
-    """
-    logger.error(f"Unexpected error in {request.url.path}: {type(exc).__name__}: {exc}", exc_info=True)
-    
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "success": False,
-            "error_type": type(exc).__name__,
-            "message": "An unexpected error occurred. Please try again."
-        }
-    )
-
 # Configure CORS
+# CORS_ALLOW_ORIGINS is a comma-separated list; in production, specify the
+# actual origins. Browsers may cache preflight results for a day.
+cors_origins = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
+    if origin.strip()
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
+    allow_origins=cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "DELETE"),
+    allow_headers=("content-type", "authorization"),
+    max_age=86400,
 )
 
+
+class StreamSafeGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves the command SSE stream uncompressed.
+    
+    GzipFile holds streamed chunks until a deflate block fills, which would
+    stall narrative text on its way to the client, so streaming paths are
+    passed through untouched.
+    """
+    
+    STREAMING_PATHS = frozenset({"/api/command"})
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.STREAMING_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress large JSON responses (game state, share listings)
+app.add_middleware(StreamSafeGZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+@lru_cache(maxsize=None)
+def _load_page(filename: str) -> Tuple[bytes, str]:
+    """
+    Read a static HTML page once per process.
+    
+    Args:
+        filename: File name inside the static directory
+        
+    Returns:
+        Tuple of (page bytes, quoted ETag derived from the content)
+    """
+    with open(os.path.join("static", filename), "rb") as f:
+        content = f.read()
+    return content, f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def _serve_page(request: Request, filename: str) -> Response:
+    """
+    Serve a cached HTML page, answering 304 when the client's copy is current.
+    
+    Pages are read on first request and kept in memory, so edits to the
+    HTML files take effect after a restart.
+    """
+    content, etag = _load_page(filename)
+    headers = {"ETag": etag}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="text/html", headers=headers)
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main game page."""
-    return FileResponse("static/index.html")
+    return _serve_page(request, "index.html")
 
 
 @app.get("/privacy")
-async def privacy():
+async def privacy(request: Request):
     """Serve the privacy policy page."""
-    return FileResponse("static/privacy.html")
+    return _serve_page(request, "privacy.html")
 
 
 @app.get("/terms")
-async def terms():
+async def terms(request: Request):
     """Serve the user agreement page."""
-    return FileResponse("static/terms.html")
+    return _serve_page(request, "terms.html")
 
 
 @app.get("/about")
-async def about():
+async def about(request: Request):
     """Serve the about page."""
-    return FileResponse("static/about.html")
+    return _serve_page(request, "about.html")
+
+
+# Load balancers poll /api/health every few seconds per instance, and each
+# Strands check calls the model, so results are reused for a short window
+_HEALTH_TTL_SECONDS = 5.0
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_health_lock = asyncio.Lock()
+
+
+async def _cached_strands_health() -> Dict[str, Any]:
+    """
+    Return the Strands health result, refreshing it at most once per TTL.
+    
+    Concurrent callers wait on a lock while one of them refreshes, so an
+    expired entry triggers a single check rather than one per request.
+    """
+    global _health_cache
+    
+    async with _health_lock:
+        now = time.monotonic()
+        if _health_cache is None or now - _health_cache[0] >= _HEALTH_TTL_SECONDS:
+            _health_cache = (now, await check_strands_health())
+        return _health_cache[1]
 
 
 @app.get("/api/health")
@@ -161,15 +277,13 @@ async def health_check():
     Returns:
         JSON response with status including Strands health
     """
-    from backend.utils.error_handling import check_strands_health
-    
     # Check Strands health
-    strands_health = await check_strands_health()
+    strands_health = await _cached_strands_health()
     
     # Overall health is healthy only if Strands is healthy
     overall_healthy = strands_health.get("healthy", False)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_200_OK if overall_healthy else status.HTTP_503_SERVICE_UNAVAILABLE,
         content={
             "status": "healthy" if overall_healthy else "degraded",
@@ -190,27 +304,35 @@ async def info():
     Returns:
         JSON response with API details
     """
-    return JSONResponse(
-        content={
-            "name": "Nature42 API",
-            "version": "0.1.0",
-            "description": "AI-powered text adventure game backend",
-            "endpoints": {
-                "health": "/api/health",
-                "command": "/api/command (POST)",
-                "state": "/api/state (GET/POST/DELETE)"
-            }
+    return {
+        "name": "Nature42 API",
+        "version": "0.1.0",
+        "description": "AI-powered text adventure game backend",
+        "endpoints": {
+            "health": "/api/health",
+            "command": "/api/command (POST)",
+            "state": "/api/state (GET/POST/DELETE)"
         }
-    )
+    }
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     
     port = int(os.getenv("PORT", 8080))
+    # Shared postcards are kept in process memory (see SharingService), so
+    # extra workers would not see each other's shares; only raise
+    # WEB_CONCURRENCY once shares move to shared storage.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # uvloop and httptools come with uvicorn[standard]; uvloop is not
+    # available on Windows, where the default asyncio loop is used
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=port,
-        reload=True
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools",
+        workers=workers,
+        reload=os.getenv("UVICORN_RELOAD", "false").lower() == "true"
     )
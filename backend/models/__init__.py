@@ -14,6 +14,7 @@ from .share import (
 )
 
 from .difficulty import (
+    DifficultySettings,
     DIFFICULTY_CURVE,
     get_difficulty_settings,
     get_target_time,
@@ -47,6 +48,7 @@ __all__ = [
     # Share models
     'ShareablePostcard',
     # Difficulty configuration
+    'DifficultySettings',
     'DIFFICULTY_CURVE',
     'get_difficulty_settings',
     'get_target_time',
@@ -5,51 +5,90 @@ Defines the difficulty curve across the six doors, with progressive increases
 in complexity, time requirements, and challenge level.
 """
 
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
 
 
-# Difficulty progression for each door (1-6)
+@dataclass(frozen=True, slots=True)
+class DifficultySettings:
+    """
+    Fixed difficulty parameters for a single door.
+
+    Attributes:
+        target_time_minutes: Target completion time in minutes
+        puzzle_complexity: "simple", "moderate", "complex", or "very_complex"
+        world_size: "small", "medium", "large", or "very_large"
+        hint_generosity: "high", "medium", "low", or "minimal"
+    """
+    target_time_minutes: float
+    puzzle_complexity: str
+    world_size: str
+    hint_generosity: str
+
+
+# Difficulty progression for each door, indexed by door_number - 1
+_CURVE: Tuple[DifficultySettings, ...] = (
+    DifficultySettings(7.5, "simple", "small", "high"),  # 5-10 min, 3-5 locations
+    DifficultySettings(15, "moderate", "medium", "high"),  # 5-8 locations
+    DifficultySettings(30, "moderate", "medium", "medium"),
+    DifficultySettings(45, "complex", "large", "medium"),  # 8-12 locations
+    DifficultySettings(75, "complex", "large", "low"),
+    DifficultySettings(150, "very_complex", "very_large", "minimal"),  # 2-3 hours, 12-20 locations
+)
+
+# Dict view of the curve keyed by door number (1-6), kept for existing importers
 DIFFICULTY_CURVE: Dict[int, Dict[str, Any]] = {
-    1: {
-        "target_time_minutes": 7.5,  # 5-10 min range
-        "puzzle_complexity": "simple",
-        "world_size": "small",  # 3-5 locations
-        "hint_generosity": "high"
-    },
-    2: {
-        "target_time_minutes": 15,
-        "puzzle_complexity": "moderate",
-        "world_size": "medium",  # 5-8 locations
-        "hint_generosity": "high"
-    },
-    3: {
-        "target_time_minutes": 30,
-        "puzzle_complexity": "moderate",
-        "world_size": "medium",
-        "hint_generosity": "medium"
-    },
-    4: {
-        "target_time_minutes": 45,
-        "puzzle_complexity": "complex",
-        "world_size": "large",  # 8-12 locations
-        "hint_generosity": "medium"
-    },
-    5: {
-        "target_time_minutes": 75,
-        "puzzle_complexity": "complex",
-        "world_size": "large",
-        "hint_generosity": "low"
-    },
-    6: {
-        "target_time_minutes": 150,  # 2-3 hours
-        "puzzle_complexity": "very_complex",
-        "world_size": "very_large",  # 12-20 locations
-        "hint_generosity": "minimal"
+    door: {
+        "target_time_minutes": s.target_time_minutes,
+        "puzzle_complexity": s.puzzle_complexity,
+        "world_size": s.world_size,
+        "hint_generosity": s.hint_generosity
     }
+    for door, s in enumerate(_CURVE, start=1)
 }
 
+# Location count bounds for each world size
+_SIZE_RANGES: Dict[str, Tuple[int, int]] = {
+    "small": (3, 5),
+    "medium": (5, 8),
+    "large": (8, 12),
+    "very_large": (12, 20)
+}
+
+# (min_locations, max_locations) per door, indexed by door_number - 1
+_LOCATION_RANGES: Tuple[Tuple[int, int], ...] = tuple(
+    _SIZE_RANGES[s.world_size] for s in _CURVE
+)
+
+# Read-only settings views per door, indexed by door_number - 1
+_FROZEN_SETTINGS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(dict(DIFFICULTY_CURVE[door])) for door in range(1, 7)
+)
+
+# Target time per door, indexed by door_number - 1
+_TARGET_TIMES: Tuple[float, ...] = tuple(s.target_time_minutes for s in _CURVE)
 
-def get_difficulty_settings(door_number: int) -> Dict[str, Any]:
+
+def _settings(door_number: int) -> DifficultySettings:
+    """
+    Look up the settings row for a door.
+
+    Args:
+        door_number: Door number (1-6)
+
+    Returns:
+        DifficultySettings for the door
+
+    Raises:
+        ValueError: If door_number is not between 1 and 6
+    """
+    if not 1 <= door_number <= 6:
+        raise ValueError(f"Door number must be between 1 and 6, got {door_number}")
+    return _CURVE[door_number - 1]
+
+
+def get_difficulty_settings(door_number: int) -> Mapping[str, Any]:
     """
     Get difficulty settings for a specific door.
     
@@ -57,15 +96,14 @@ def get_difficulty_settings(door_number: int) -> Dict[str, Any]:
         door_number: Door number (1-6)
         
     Returns:
-        Dictionary containing difficulty settings
+        Read-only mapping of difficulty settings; callers that need to
+        modify it should copy it with dict()
         
     Raises:
         ValueError: If door_number is not between 1 and 6
     """
-    if door_number not in DIFFICULTY_CURVE:
-        raise ValueError(f"Door number must be between 1 and 6, got {door_number}")
-    
-    return DIFFICULTY_CURVE[door_number].copy()
+    _settings(door_number)
+    return _FROZEN_SETTINGS[door_number - 1]
 
 
 def get_target_time(door_number: int) -> float:
@@ -78,8 +116,7 @@ def get_target_time(door_number: int) -> float:
     Returns:
         Target time in minutes
     """
-    settings = get_difficulty_settings(door_number)
-    return settings["target_time_minutes"]
+    return _settings(door_number).target_time_minutes
 
 
 def get_puzzle_complexity(door_number: int) -> str:
@@ -92,8 +129,7 @@ def get_puzzle_complexity(door_number: int) -> str:
     Returns:
         Complexity level: "simple", "moderate", "complex", or "very_complex"
     """
-    settings = get_difficulty_settings(door_number)
-    return settings["puzzle_complexity"]
+    return _settings(door_number).puzzle_complexity
 
 
 def get_world_size(door_number: int) -> str:
@@ -106,8 +142,7 @@ def get_world_size(door_number: int) -> str:
     Returns:
         World size: "small", "medium", "large", or "very_large"
     """
-    settings = get_difficulty_settings(door_number)
-    return settings["world_size"]
+    return _settings(door_number).world_size
 
 
 def get_hint_generosity(door_number: int) -> str:
@@ -120,8 +155,7 @@ def get_hint_generosity(door_number: int) -> str:
     Returns:
         Hint generosity: "high", "medium", "low", or "minimal"
     """
-    settings = get_difficulty_settings(door_number)
-    return settings["hint_generosity"]
+    return _settings(door_number).hint_generosity
 
 
 def get_location_count_range(door_number: int) -> tuple[int, int]:
@@ -134,16 +168,9 @@ def get_location_count_range(door_number: int) -> tuple[int, int]:
     Returns:
         Tuple of (min_locations, max_locations)
     """
-    world_size = get_world_size(door_number)
-    
-    size_ranges = {
-        "small": (3, 5),
-        "medium": (5, 8),
-        "large": (8, 12),
-        "very_large": (12, 20)
-    }
-    
-    return size_ranges.get(world_size, (5, 8))
+    if not 1 <= door_number <= 6:
+        raise ValueError(f"Door number must be between 1 and 6, got {door_number}")
+    return _LOCATION_RANGES[door_number - 1]
 
 
 def is_difficulty_increasing(door_a: int, door_b: int) -> bool:
@@ -159,6 +186,6 @@ def is_difficulty_increasing(door_a: int, door_b: int) -> bool:
     Returns:
         True if door B is more difficult than door A
     """
-    time_a = get_target_time(door_a)
-    time_b = get_target_time(door_b)
-    return time_b >= time_a
+    if not (1 <= door_a <= 6 and 1 <= door_b <= 6):
+        raise ValueError(f"Door numbers must be between 1 and 6, got {door_a} and {door_b}")
+    return _TARGET_TIMES[door_b - 1] >= _TARGET_TIMES[door_a - 1]
@@ -5,13 +5,46 @@ These models represent the complete state of the game including player location,
 inventory, collected keys, visited locations, NPC interactions, puzzles, and decisions.
 """
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional, Any
-import json
+from functools import lru_cache
+from collections.abc import MutableMapping
+from typing import List, Dict, Iterator, Optional, Any, Set, Tuple
 
+import orjson
 
-@dataclass
+
+def _encode_mapping(obj: Any) -> Dict[str, Any]:
+    """orjson default hook for non-dict mappings such as LazyLocationDict."""
+    if isinstance(obj, MutableMapping):
+        return dict(obj.items())
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _parse_dt(value: Any) -> datetime:
+    """
+    Read a datetime from a state dictionary.
+    
+    to_dict leaves datetimes as datetime objects for orjson to encode, while
+    decoded client JSON carries ISO 8601 strings, so both are accepted.
+    """
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a repeated identifier string read from a state dictionary.
+    
+    Client JSON is not validated before parsing, so anything other than an
+    exact str (which sys.intern rejects) is returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Item:
     """An item in the game."""
     id: str
@@ -23,15 +56,29 @@ class Item:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'is_key': self.is_key,
+            'door_number': self.door_number,
+            'properties': self.properties
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Item':
         """Create Item from dictionary."""
-        return cls(**data)
+        return cls(
+            id=data['id'],
+            name=data['name'],
+            description=data['description'],
+            is_key=data.get('is_key', False),
+            door_number=data.get('door_number'),
+            properties=data.get('properties', {})
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationData:
     """Cached data for a generated location."""
     id: str
@@ -51,7 +98,7 @@ class LocationData:
             'exits': self.exits,
             'items': [item.to_dict() for item in self.items],
             'npcs': self.npcs,
-            'generated_at': self.generated_at.isoformat()
+            'generated_at': self.generated_at
         }
 
     @classmethod
@@ -64,11 +111,72 @@ class LocationData:
             exits=data['exits'],
             items=[Item.from_dict(item) for item in data['items']],
             npcs=data['npcs'],
-            generated_at=datetime.fromisoformat(data['generated_at'])
+            generated_at=_parse_dt(data['generated_at'])
         )
 
 
-@dataclass
+# Keys LocationData.from_dict reads, checked up front for lazily parsed locations
+_LOCATION_KEYS = frozenset({
+    'id', 'description', 'image_url', 'exits', 'items', 'npcs', 'generated_at'
+})
+
+
+class LazyLocationDict(MutableMapping):
+    """
+    Mapping of location IDs to LocationData that parses entries on first access.
+    
+    A command usually touches only the current location and its neighbours,
+    so a state's other visited locations are kept as their raw dictionaries
+    until something reads them. Membership tests, len() and key iteration
+    never parse anything.
+    
+    Each raw location is checked for the keys LocationData needs when the
+    mapping is built, so a location with missing fields is rejected along
+    with the rest of the state rather than failing mid-command.
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self, raw: Dict[str, Any]):
+        """
+        Args:
+            raw: Location dictionaries keyed by location ID
+            
+        Raises:
+            ValueError: If a location is not a dictionary or lacks a field
+        """
+        for loc_id, loc in raw.items():
+            if not isinstance(loc, dict) or not _LOCATION_KEYS <= loc.keys():
+                raise ValueError(f"Malformed location: {loc_id}")
+        # Values are raw dicts until first read, then LocationData
+        self._data: Dict[str, Any] = dict(raw)
+    
+    def __getitem__(self, loc_id: str) -> LocationData:
+        value = self._data[loc_id]
+        if isinstance(value, dict):
+            value = self._data[loc_id] = LocationData.from_dict(value)
+        return value
+    
+    def __setitem__(self, loc_id: str, location: LocationData) -> None:
+        self._data[loc_id] = location
+    
+    def __delitem__(self, loc_id: str) -> None:
+        del self._data[loc_id]
+    
+    def __contains__(self, loc_id: object) -> bool:
+        return loc_id in self._data
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._data)!r})"
+
+
+@dataclass(slots=True)
 class Interaction:
     """Record of player-NPC interaction."""
     timestamp: datetime
@@ -80,7 +188,7 @@ class Interaction:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,
             'npc_id': self.npc_id,
             'player_action': self.player_action,
             'npc_response': self.npc_response,
@@ -89,17 +197,22 @@ class Interaction:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Interaction':
-        """Create Interaction from dictionary."""
+        """
+        Create Interaction from dictionary.
+        
+        NPC IDs and sentiments repeat across many interactions, so they are
+        interned to share one string object per distinct value.
+        """
         return cls(
-            timestamp=datetime.fromisoformat(data['timestamp']),
-            npc_id=data['npc_id'],
+            timestamp=_parse_dt(data['timestamp']),
+            npc_id=_intern(data['npc_id']),
             player_action=data['player_action'],
             npc_response=data['npc_response'],
-            sentiment=data['sentiment']
+            sentiment=_intern(data['sentiment'])
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PuzzleState:
     """State of a puzzle."""
     puzzle_id: str
@@ -110,15 +223,27 @@ class PuzzleState:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            'puzzle_id': self.puzzle_id,
+            'description': self.description,
+            'solved': self.solved,
+            'attempts': self.attempts,
+            'hints_given': self.hints_given
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PuzzleState':
         """Create PuzzleState from dictionary."""
-        return cls(**data)
+        return cls(
+            puzzle_id=data['puzzle_id'],
+            description=data['description'],
+            solved=data['solved'],
+            attempts=data['attempts'],
+            hints_given=data['hints_given']
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """Significant player choice."""
     timestamp: datetime
@@ -129,7 +254,7 @@ class Decision:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,
             'location_id': self.location_id,
             'description': self.description,
             'consequences': self.consequences
@@ -137,22 +262,26 @@ class Decision:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Decision':
-        """Create Decision from dictionary."""
+        """
+        Create Decision from dictionary.
+        
+        Location IDs repeat across the decision history and are interned.
+        """
         return cls(
-            timestamp=datetime.fromisoformat(data['timestamp']),
-            location_id=data['location_id'],
+            timestamp=_parse_dt(data['timestamp']),
+            location_id=_intern(data['location_id']),
             description=data['description'],
             consequences=data['consequences']
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Complete state of the game."""
     player_location: str
     inventory: List[Item]
     keys_collected: List[int]  # Door numbers (1-6)
-    visited_locations: Dict[str, LocationData]
+    visited_locations: MutableMapping[str, LocationData]
     npc_interactions: Dict[str, List[Interaction]]
     puzzle_states: Dict[str, PuzzleState]
     decision_history: List[Decision]
@@ -161,9 +290,18 @@ class GameState:
     last_updated: datetime
     conversation_history: List[Dict[str, str]] = field(default_factory=list)  # AI conversation context
     debug_mode: bool = False  # Debug mode flag
+    # (source list, serialized interactions) per NPC, extended on append
+    _npc_dump_cache: Dict[str, Tuple[List[Interaction], List[Dict[str, Any]]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Datetimes throughout the state are left as datetime objects, which
+        orjson encodes natively as ISO 8601 strings.
+        """
         return {
             'player_location': self.player_location,
             'inventory': [item.to_dict() for item in self.inventory],
@@ -172,57 +310,158 @@ class GameState:
                 loc_id: loc.to_dict() 
                 for loc_id, loc in self.visited_locations.items()
             },
-            'npc_interactions': {
-                npc_id: [interaction.to_dict() for interaction in interactions]
-                for npc_id, interactions in self.npc_interactions.items()
-            },
+            'npc_interactions': self._dump_npc_interactions(),
             'puzzle_states': {
                 puzzle_id: puzzle.to_dict()
                 for puzzle_id, puzzle in self.puzzle_states.items()
             },
             'decision_history': [decision.to_dict() for decision in self.decision_history],
             'current_door': self.current_door,
-            'game_started_at': self.game_started_at.isoformat(),
-            'last_updated': self.last_updated.isoformat(),
+            'game_started_at': self.game_started_at,
+            'last_updated': self.last_updated,
+            'conversation_history': self.conversation_history,
+            'debug_mode': self.debug_mode
+        }
+
+    def _dump_npc_interactions(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Serialize NPC interactions, converting only those added since the last call.
+        
+        Interaction histories are append-only, so each NPC's serialized list
+        is cached and extended with the new records. A history list that has
+        been replaced or has shrunk is rebuilt. Each call returns new lists,
+        so earlier results do not change as interactions are added, but the
+        interaction dictionaries in them are shared with the cache and must
+        not be modified.
+        """
+        cache = self._npc_dump_cache
+        dumped = {}
+        for npc_id, interactions in self.npc_interactions.items():
+            entry = cache.get(npc_id)
+            if entry is None or entry[0] is not interactions or len(entry[1]) > len(interactions):
+                entry = cache[npc_id] = (interactions, [])
+            cached = entry[1]
+            if len(cached) < len(interactions):
+                cached.extend(
+                    interaction.to_dict() for interaction in interactions[len(cached):]
+                )
+            dumped[npc_id] = list(cached)
+        return dumped
+
+    def to_delta(self, known_location_ids: Set[str], decision_count: int) -> Dict[str, Any]:
+        """
+        Convert the fields a command can change into a partial state dictionary.
+        
+        Top-level fields in the result replace the client's copy, except
+        visited_locations, which holds only locations the client has not seen
+        and is merged key by key. Decision history is included only when a
+        decision was recorded.
+        
+        Args:
+            known_location_ids: Location IDs already present in the client's state
+            decision_count: Length of decision_history before the command ran
+            
+        Returns:
+            Partial game state dictionary
+        """
+        delta = {
+            'player_location': self.player_location,
+            'inventory': [item.to_dict() for item in self.inventory],
+            'keys_collected': self.keys_collected,
+            'visited_locations': {
+                loc_id: self.visited_locations[loc_id].to_dict()
+                for loc_id in self.visited_locations
+                if loc_id not in known_location_ids
+            },
+            'current_door': self.current_door,
+            'last_updated': self.last_updated,
             'conversation_history': self.conversation_history,
             'debug_mode': self.debug_mode
         }
+        if len(self.decision_history) != decision_count:
+            delta['decision_history'] = [decision.to_dict() for decision in self.decision_history]
+        return delta
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'GameState':
-        """Create GameState from dictionary."""
+    def from_dict(cls, data: Dict[str, Any], lazy_locations: bool = False) -> 'GameState':
+        """
+        Create GameState from dictionary.
+        
+        The nested constructors are bound to locals once, since a long game
+        calls them for hundreds of records.
+        
+        Args:
+            data: Game state dictionary
+            lazy_locations: Parse visited locations only when they are read
+                (see LazyLocationDict). Missing location fields are still
+                rejected here, but malformed values (e.g. a bad timestamp)
+                surface on access, so validation paths leave this off.
+        """
+        item_from = Item.from_dict
+        loc_from = LocationData.from_dict
+        interaction_from = Interaction.from_dict
+        puzzle_from = PuzzleState.from_dict
+        decision_from = Decision.from_dict
+        
         return cls(
             player_location=data['player_location'],
-            inventory=[Item.from_dict(item) for item in data['inventory']],
+            inventory=[item_from(item) for item in data['inventory']],
             keys_collected=data['keys_collected'],
-            visited_locations={
-                loc_id: LocationData.from_dict(loc)
-                for loc_id, loc in data['visited_locations'].items()
-            },
+            visited_locations=(
+                LazyLocationDict(data['visited_locations']) if lazy_locations
+                else {
+                    loc_id: loc_from(loc)
+                    for loc_id, loc in data['visited_locations'].items()
+                }
+            ),
             npc_interactions={
-                npc_id: [Interaction.from_dict(interaction) for interaction in interactions]
+                npc_id: [interaction_from(interaction) for interaction in interactions]
                 for npc_id, interactions in data['npc_interactions'].items()
             },
             puzzle_states={
-                puzzle_id: PuzzleState.from_dict(puzzle)
+                puzzle_id: puzzle_from(puzzle)
                 for puzzle_id, puzzle in data['puzzle_states'].items()
             },
-            decision_history=[Decision.from_dict(decision) for decision in data['decision_history']],
+            decision_history=[decision_from(decision) for decision in data['decision_history']],
             current_door=data['current_door'],
-            game_started_at=datetime.fromisoformat(data['game_started_at']),
-            last_updated=datetime.fromisoformat(data['last_updated']),
+            game_started_at=_parse_dt(data['game_started_at']),
+            last_updated=_parse_dt(data['last_updated']),
             conversation_history=data.get('conversation_history', []),
             debug_mode=data.get('debug_mode', False)
         )
 
+    @classmethod
+    def from_dict_cached(cls, data: Dict[str, Any]) -> 'GameState':
+        """
+        Create GameState from dictionary, reusing recent parses of identical state.
+        
+        Clients resend the same state across consecutive requests, so the
+        parsed object is memoized on the state's canonical (key-sorted)
+        serialized bytes. Parse failures are not cached. The returned
+        instance may be shared and must be treated as read-only; use
+        from_dict when the state will be modified.
+        """
+        try:
+            key = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return cls.from_dict(data)
+        return _from_json_bytes_cached(key)
+
     def to_json(self) -> str:
-        """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        """
+        Serialize to JSON string.
+        
+        orjson encodes the dataclasses directly, field by field, producing
+        the same document as to_dict() without building the dictionaries.
+        """
+        return orjson.dumps(
+            self, default=_encode_mapping, option=orjson.OPT_INDENT_2
+        ).decode('utf-8')
 
     @classmethod
     def from_json(cls, json_str: str) -> 'GameState':
-        """Deserialize from JSON string."""
-        data = json.loads(json_str)
+        """Deserialize from JSON string or bytes."""
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
 
     @classmethod
@@ -254,3 +493,9 @@ class GameState:
             game_started_at=now,
             last_updated=now
         )
+
+
+@lru_cache(maxsize=128)
+def _from_json_bytes_cached(raw: bytes) -> GameState:
+    """Parse serialized game state; backs GameState.from_dict_cached."""
+    return GameState.from_dict(orjson.loads(raw))
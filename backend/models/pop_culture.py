@@ -7,11 +7,19 @@ generated game content.
 """
 
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Tuple
+
+
+# Generator dedicated to reference selection, independent of the global
+# random state; its bound methods are looked up once
+_rng = random.Random()
+_choice = _rng.choice
+_sample = _rng.sample
+_choices = _rng.choices
 
 
 # Pop culture references organized by decade
-POP_CULTURE_REFS: Dict[str, List[str]] = {
+_REFS_BY_DECADE: Dict[str, List[str]] = {
     "1970s": [
         "Holy Hand Grenade",
         "disco ball",
@@ -116,6 +124,46 @@ POP_CULTURE_REFS: Dict[str, List[str]] = {
     ]
 }
 
+# Each decade's references frozen, so accessors can hand them out without copying
+POP_CULTURE_REFS: Dict[str, Tuple[str, ...]] = {
+    decade: tuple(refs) for decade, refs in _REFS_BY_DECADE.items()
+}
+
+# Every reference across all decades, in decade order
+_ALL_REFS: Tuple[str, ...] = tuple(
+    ref for refs in POP_CULTURE_REFS.values() for ref in refs
+)
+
+# Reference -> decade; a reference listed under several decades maps to the earliest
+_REF_TO_DECADE: Dict[str, str] = {}
+for _decade, _refs in POP_CULTURE_REFS.items():
+    for _ref in _refs:
+        _REF_TO_DECADE.setdefault(_ref, _decade)
+del _decade, _refs, _ref
+
+# Mix of 70s, 80s and 90s references for "retro"/"vintage" themes
+_RETRO_REFS: Tuple[str, ...] = (
+    POP_CULTURE_REFS["1970s"] + POP_CULTURE_REFS["1980s"] + POP_CULTURE_REFS["1990s"]
+)
+
+# Theme keywords checked in order; a decade of None selects the retro mix
+_THEME_TOKENS: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("70s", "1970s"),
+    ("seventies", "1970s"),
+    ("80s", "1980s"),
+    ("eighties", "1980s"),
+    ("90s", "1990s"),
+    ("nineties", "1990s"),
+    ("2000s", "2000s"),
+    ("y2k", "2000s"),
+    ("2010s", "2010s"),
+    ("2020s", "2020s"),
+    ("modern", "2020s"),
+    ("contemporary", "2020s"),
+    ("retro", None),
+    ("vintage", None)
+)
+
 
 def get_all_decades() -> List[str]:
     """
@@ -127,7 +175,7 @@ def get_all_decades() -> List[str]:
     return list(POP_CULTURE_REFS.keys())
 
 
-def get_references_by_decade(decade: str) -> List[str]:
+def get_references_by_decade(decade: str) -> Tuple[str, ...]:
     """
     Get all pop culture references for a specific decade.
     
@@ -135,7 +183,7 @@ def get_references_by_decade(decade: str) -> List[str]:
         decade: Decade string (e.g., "1970s", "1980s")
         
     Returns:
-        List of pop culture references
+        Tuple of pop culture references (shared; use list() for a mutable copy)
         
     Raises:
         ValueError: If decade is not in the database
@@ -144,7 +192,7 @@ def get_references_by_decade(decade: str) -> List[str]:
         available = ", ".join(POP_CULTURE_REFS.keys())
         raise ValueError(f"Decade '{decade}' not found. Available: {available}")
     
-    return POP_CULTURE_REFS[decade].copy()
+    return POP_CULTURE_REFS[decade]
 
 
 def get_random_reference(decade: str) -> str:
@@ -158,7 +206,7 @@ def get_random_reference(decade: str) -> str:
         Random pop culture reference
     """
     references = get_references_by_decade(decade)
-    return random.choice(references)
+    return _choice(references)
 
 
 def get_random_references(decade: str, count: int = 1) -> List[str]:
@@ -175,10 +223,10 @@ def get_random_references(decade: str, count: int = 1) -> List[str]:
     references = get_references_by_decade(decade)
     
     if count <= len(references):
-        return random.sample(references, count)
+        return _sample(references, count)
     else:
         # If requesting more than available, sample with replacement
-        return random.choices(references, k=count)
+        return _choices(references, k=count)
 
 
 def get_random_reference_any_era() -> str:
@@ -188,7 +236,7 @@ def get_random_reference_any_era() -> str:
     Returns:
         Random pop culture reference
     """
-    decade = random.choice(get_all_decades())
+    decade = _choice(get_all_decades())
     return get_random_reference(decade)
 
 
@@ -202,14 +250,10 @@ def get_random_references_mixed(count: int = 3) -> List[str]:
     Returns:
         List of random pop culture references from various decades
     """
-    all_refs = []
-    for refs in POP_CULTURE_REFS.values():
-        all_refs.extend(refs)
-    
-    if count <= len(all_refs):
-        return random.sample(all_refs, count)
+    if count <= len(_ALL_REFS):
+        return _sample(_ALL_REFS, count)
     else:
-        return random.choices(all_refs, k=count)
+        return _choices(_ALL_REFS, k=count)
 
 
 def get_reference_decade(reference: str) -> str:
@@ -225,14 +269,13 @@ def get_reference_decade(reference: str) -> str:
     Raises:
         ValueError: If reference is not found in any decade
     """
-    for decade, refs in POP_CULTURE_REFS.items():
-        if reference in refs:
-            return decade
-    
-    raise ValueError(f"Reference '{reference}' not found in database")
+    try:
+        return _REF_TO_DECADE[reference]
+    except KeyError:
+        raise ValueError(f"Reference '{reference}' not found in database")
 
 
-def get_references_for_theme(theme: str) -> List[str]:
+def get_references_for_theme(theme: str) -> Sequence[str]:
     """
     Get pop culture references appropriate for a theme or time period.
     
@@ -243,30 +286,14 @@ def get_references_for_theme(theme: str) -> List[str]:
         theme: Theme description (e.g., "retro", "modern", "80s nostalgia")
         
     Returns:
-        List of appropriate pop culture references
+        Sequence of appropriate pop culture references
     """
     theme_lower = theme.lower()
     
     # Map themes to decades
-    if "70s" in theme_lower or "seventies" in theme_lower:
-        return get_references_by_decade("1970s")
-    elif "80s" in theme_lower or "eighties" in theme_lower:
-        return get_references_by_decade("1980s")
-    elif "90s" in theme_lower or "nineties" in theme_lower:
-        return get_references_by_decade("1990s")
-    elif "2000s" in theme_lower or "y2k" in theme_lower:
-        return get_references_by_decade("2000s")
-    elif "2010s" in theme_lower:
-        return get_references_by_decade("2010s")
-    elif "2020s" in theme_lower or "modern" in theme_lower or "contemporary" in theme_lower:
-        return get_references_by_decade("2020s")
-    elif "retro" in theme_lower or "vintage" in theme_lower:
-        # Mix of 70s, 80s, 90s
-        refs = []
-        refs.extend(get_references_by_decade("1970s"))
-        refs.extend(get_references_by_decade("1980s"))
-        refs.extend(get_references_by_decade("1990s"))
-        return refs
-    else:
-        # Default: return mixed references from all eras
-        return get_random_references_mixed(10)
+    for token, decade in _THEME_TOKENS:
+        if token in theme_lower:
+            return POP_CULTURE_REFS[decade] if decade else _RETRO_REFS
+    
+    # Default: return mixed references from all eras
+    return get_random_references_mixed(10)
@@ -5,13 +5,14 @@ These models represent shareable postcards that players can generate
 to share their game progress and discoveries.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import Dict, Any
-import json
+from typing import Dict, Any, Optional
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class ShareablePostcard:
     """
     A shareable postcard containing non-spoiler game information.
@@ -25,17 +26,25 @@ class ShareablePostcard:
     location_image_url: str
     keys_collected: int
     created_at: datetime
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'share_code': self.share_code,
-            'location_name': self.location_name,
-            'location_description': self.location_description,
-            'location_image_url': self.location_image_url,
-            'keys_collected': self.keys_collected,
-            'created_at': self.created_at.isoformat()
-        }
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Postcards are snapshots that never change after creation, so the
+        dictionary is built once and reused; callers must not modify it.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'share_code': self.share_code,
+                'location_name': self.location_name,
+                'location_description': self.location_description,
+                'location_image_url': self.location_image_url,
+                'keys_collected': self.keys_collected,
+                'created_at': self.created_at
+            }
+        return self._cached_dict
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ShareablePostcard':
@@ -46,15 +55,23 @@ class ShareablePostcard:
             location_description=data['location_description'],
             location_image_url=data['location_image_url'],
             keys_collected=data['keys_collected'],
-            created_at=datetime.fromisoformat(data['created_at'])
+            created_at=(
+                data['created_at'] if isinstance(data['created_at'], datetime)
+                else datetime.fromisoformat(data['created_at'])
+            )
         )
     
     def to_json(self) -> str:
-        """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        """
+        Serialize to JSON string.
+        
+        orjson encodes the dataclass directly; the underscore-prefixed
+        cache field is skipped, so the output matches to_dict().
+        """
+        return orjson.dumps(self, option=orjson.OPT_INDENT_2).decode('utf-8')
     
     @classmethod
     def from_json(cls, json_str: str) -> 'ShareablePostcard':
-        """Deserialize from JSON string."""
-        data = json.loads(json_str)
+        """Deserialize from JSON string or bytes."""
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
@@ -5,22 +5,306 @@ This module contains handlers for basic game actions like movement,
 inventory management, examination, and help.
 """
 
-from typing import Optional
+import asyncio
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import AsyncIterator, Callable, Dict, FrozenSet, Optional, Tuple
+
+from strands import Agent
+
+from backend.services.bedrock import get_bedrock_model
 from backend.services.command_models import ActionResult
-from backend.models.game_state import GameState
+from backend.models.game_state import GameState, Item
+from backend.services.content_generator import ContentGenerator, PLAYER_HISTORY_WINDOW
+from backend.services.door_handlers import DoorHandlers
+from backend.services.forest_clearing import get_door_description, get_vault_description
+from backend.utils.cache import TTLCache
+from backend.utils.error_handling import logger
+from backend.services.semantic_cache import (
+    MISS,
+    get_exit_match_cache,
+    get_npc_match_cache,
+    match_exit_locally,
+    match_npc_locally,
+    normalize_direction
+)
+
+
+# Threads for blocking Bedrock calls, sized for concurrent players rather
+# than the default executor's CPU-based limit
+_BEDROCK_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="bedrock")
+
+# Directions that lead back to the forest clearing
+_RETURN_DIRECTIONS = frozenset({"back", "return", "clearing", "forest clearing", "exit"})
+
+# Examine targets that mean the current location as a whole
+_SURROUNDINGS_TARGETS = frozenset({"area", "room", "surroundings", "location", "here"})
+
+# Door numbers as players spell them, in door order
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6}
+
+# Door number tokens (words and digits) to door numbers
+_DOOR_NUMBER_TOKENS = {**_NUMBER_WORDS, **{str(n): n for n in _NUMBER_WORDS.values()}}
+
+# Every keyword examine routes on, found in one scan of the target
+_EXAMINE_KEYWORDS_RE = re.compile("|".join(["vault", "door", *_DOOR_NUMBER_TOKENS]))
+
+# Recent examine, hint and talk responses keyed by the state they answered
+# (see ActionHandlers._narration_key)
+_NARRATION_CACHE = TTLCache(maxsize=512, ttl=60.0)
+
+# Exit matches awaiting the model, keyed by (exits, normalized direction)
+_EXIT_MATCHES_IN_FLIGHT: Dict[Tuple[Tuple[str, ...], FrozenSet[str]], "asyncio.Future[Optional[str]]"] = {}
+
+# Fixed instructions for the NPC matcher; only the target and the NPC list
+# change per call, so they go in the user message after the cache point
+_NPC_MATCH_SYSTEM_PROMPT = """You match what a player wants to talk to against the NPCs present.
+
+The NPCs are given as a numbered list. Respond with ONLY the number of the NPC that best matches what the player wants, or 0 if no match.
+Do not include any explanation or extra text.
+
+Examples:
+- "the squirrel" matches "A peculiar squirrel with intelligent eyes"
+- "rabbit" matches "Thumper the Wise Rabbit"
+- "keeper" matches "The Cabbage Patch Keeper"
+"""
+
+# The NPC number in the matcher's reply
+_NPC_NUMBER_RE = re.compile(r"\d+")
+
+# Tool the take-item check must call, so its answer arrives as structured input
+_TAKE_ITEM_TOOL = {
+    "name": "take_item_decision",
+    "description": "Report whether the player can take the item they asked for.",
+    "inputSchema": {
+        "json": {
+            "type": "object",
+            "properties": {
+                "can_take": {
+                    "type": "boolean",
+                    "description": "Whether the item is here and can reasonably be picked up"
+                },
+                "item_name": {
+                    "type": "string",
+                    "description": "Exact name of the item"
+                },
+                "message": {
+                    "type": "string",
+                    "description": "Response to the player"
+                },
+                "is_key": {
+                    "type": "boolean",
+                    "description": "Whether the item is the key for this world"
+                }
+            },
+            "required": ["can_take", "item_name", "message", "is_key"]
+        }
+    }
+}
+
+
+@lru_cache(maxsize=128)
+def _npc_index(npcs: Tuple[str, ...]) -> Tuple[Dict[str, str], Tuple[FrozenSet[str], ...]]:
+    """
+    Build lookup tables for matching talk targets against a set of NPCs.
+    
+    Locations keep the same NPCs between turns, so the tables are built
+    once per NPC set and reused. The returned dict is shared and must not
+    be modified.
+    
+    Args:
+        npcs: NPC names at the player's location
+        
+    Returns:
+        Tuple of (casefolded full name -> NPC name, casefolded words longer
+        than two characters of each NPC name, in NPC order)
+    """
+    by_name: Dict[str, str] = {}
+    npc_words = []
+    for npc_name in npcs:
+        npc_folded = npc_name.casefold()
+        by_name.setdefault(npc_folded, npc_name)
+        npc_words.append(frozenset(word for word in npc_folded.split() if len(word) > 2))
+    return by_name, tuple(npc_words)
+
+
+def _match_npc_locally(player_target: str, available_npcs: list[str]) -> Optional[str]:
+    """
+    Match a talk target to a listed NPC without calling the model.
+    
+    Tries an exact name, then a fragment of exactly one NPC's name, then a
+    word match (see match_npc_locally).
+    
+    Args:
+        player_target: What the player said (e.g., "rabbit")
+        available_npcs: NPC names at the player's location
+        
+    Returns:
+        The matched NPC name, or None if no local match
+    """
+    player_target = player_target.strip()
+    if not available_npcs or not player_target:
+        return None
+    
+    by_name, _ = _npc_index(tuple(available_npcs))
+    player_folded = player_target.casefold()
+    
+    exact = by_name.get(player_folded)
+    if exact is not None:
+        return exact
+    
+    containing = [npc_name for npc_folded, npc_name in by_name.items() if player_folded in npc_folded]
+    if len(containing) == 1:
+        return containing[0]
+    
+    return match_npc_locally(player_target, available_npcs)
+
+
+@lru_cache(maxsize=128)
+def _render_npc_list(npcs: Tuple[str, ...]) -> str:
+    """
+    Render the numbered NPC list for the NPC matcher prompt.
+    
+    Args:
+        npcs: NPC names at the player's location
+        
+    Returns:
+        One "number. name" line per NPC, numbered from 1
+    """
+    return "\n".join(f"{number}. {npc}" for number, npc in enumerate(npcs, 1))
+
+
+# Marks the end of a streamed model response on its queue
+_STREAM_END = object()
+
+
+def _pump_model_text(model, request: dict, loop, queue: asyncio.Queue, cancelled: threading.Event) -> None:
+    """
+    Run a streaming model request on a Bedrock thread, queueing its text.
+    
+    Text deltas are handed to the event loop as they arrive. The request
+    stops early once cancelled is set, and always ends by queueing an
+    exception (if the call failed) followed by _STREAM_END.
+    
+    Args:
+        model: Bedrock model to call
+        request: Request built by model.format_request
+        loop: Event loop that owns the queue
+        queue: Queue receiving text, errors and _STREAM_END
+        cancelled: Set by the consumer when it stops reading
+    """
+    def put(item) -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+    
+    try:
+        events = model.stream(request)
+        try:
+            for event in events:
+                if cancelled.is_set():
+                    break
+                text = event.get("contentBlockDelta", {}).get("delta", {}).get("text")
+                if text:
+                    put(text)
+        finally:
+            events.close()
+    except Exception as e:
+        put(e)
+    finally:
+        put(_STREAM_END)
+
+
+async def _stream_agent_text(
+    model,
+    system_prompt: str,
+    prompt: str,
+    fallback: str,
+    on_complete: Optional[Callable[[str], None]] = None
+) -> AsyncIterator[str]:
+    """
+    Stream the text of a narrative model response as it is generated.
+    
+    The model call starts when iteration begins and runs on a Bedrock
+    thread. If it fails before any text was produced, the fallback message
+    is yielded instead; a failure partway through ends the stream with the
+    text sent so far. Closing the stream early (the client disconnected)
+    tells the thread to stop without waiting for it.
+    
+    Args:
+        model: Bedrock model to call
+        system_prompt: System prompt for the call
+        prompt: Player message for the call
+        fallback: Message to yield if the call fails before any text
+        on_complete: Called with the full response text if the call succeeds
+        
+    Yields:
+        Chunks of response text
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    cancelled = threading.Event()
+    request = model.format_request(
+        [{"role": "user", "content": [{"text": prompt}]}],
+        system_prompt=system_prompt
+    )
+    loop.run_in_executor(_BEDROCK_EXECUTOR, _pump_model_text, model, request, loop, queue, cancelled)
+    
+    chunks = []
+    try:
+        while (item := await queue.get()) is not _STREAM_END:
+            if isinstance(item, Exception):
+                raise item
+            chunks.append(item)
+            yield item
+    except Exception as e:
+        logger.error(f"Error streaming model response: {e}")
+        if not chunks:
+            yield fallback
+        return
+    finally:
+        cancelled.set()
+    if on_complete is not None:
+        on_complete("".join(chunks).strip())
 
 
 class ActionHandlers:
     """Handles basic game actions."""
     
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, stream_text: bool = False):
         """
         Initialize action handlers.
         
         Args:
             game_state: Current game state
+            stream_text: Return the examine, hint and talk narration as a
+                message_stream of text chunks instead of a finished message
         """
         self.game_state = game_state
+        self.stream_text = stream_text
+    
+    def _narration_key(self, action: str, target: Optional[str], location_description: str) -> tuple:
+        """
+        Build the _NARRATION_CACHE key for a narrative action.
+        
+        The key covers everything the action's prompt is built from, so a
+        cached response is only reused while that context is unchanged.
+        Location descriptions are included because location IDs can repeat
+        across players whose worlds were generated differently.
+        """
+        state = self.game_state
+        return (
+            action,
+            target.lower() if target else None,
+            state.player_location,
+            location_description,
+            tuple(sorted(state.keys_collected)),
+            state.current_door,
+            tuple(item.id for item in state.inventory),
+            len(state.decision_history)
+        )
     
     async def handle_movement(self, direction: str) -> ActionResult:
         """
@@ -40,7 +324,7 @@ class ActionHandlers:
             ActionResult with new location
         """
         # Check for special movement commands
-        if direction.lower() in ["back", "return", "clearing", "forest clearing", "exit"]:
+        if direction.lower() in _RETURN_DIRECTIONS:
             # Return to forest clearing
             if self.game_state.current_door is not None:
                 return ActionResult(
@@ -89,8 +373,6 @@ class ActionHandlers:
             )
         
         # Generate new location
-        from backend.services.content_generator import ContentGenerator
-        import asyncio
         
         generator = ContentGenerator()
         
@@ -98,7 +380,11 @@ class ActionHandlers:
             # Generate the new location
             location = await generator.generate_location(
                 door_number=self.game_state.current_door or 1,
-                player_history=[d.to_dict() for d in self.game_state.decision_history],
+                # Only the recent decisions are used, so only those are converted
+                player_history=[
+                    d.to_dict()
+                    for d in self.game_state.decision_history[-PLAYER_HISTORY_WINDOW:]
+                ],
                 keys_collected=len(self.game_state.keys_collected),
                 location_id=new_location_id
             )
@@ -118,10 +404,8 @@ class ActionHandlers:
                 }
             )
         except Exception as e:
-            # Log the error
-            import traceback
-            print(f"Error generating location: {e}")
-            print(traceback.format_exc())
+            # Log the error; the traceback is formatted only if a handler emits it
+            logger.error(f"Error generating location: {e}", exc_info=True)
             
             # CRITICAL: Do NOT update player location on error
             # Stay in current location to prevent limbo
@@ -141,26 +425,67 @@ class ActionHandlers:
         Returns:
             The matched exit name, or None if no match
         """
-        import os
-        import json
-        from strands import Agent
-        from strands.models import BedrockModel
-        
         # Quick exact match first
         for exit_name in available_exits:
             if player_direction.lower() == exit_name.lower():
                 return exit_name
         
+        # Clear word matches need no AI call
+        local_match = match_exit_locally(player_direction, available_exits)
+        if local_match:
+            return local_match
+        
+        # Reuse an earlier match for the same (or equivalent) phrasing
+        cached = get_exit_match_cache().get(player_direction, available_exits)
+        if cached is not MISS:
+            return cached
+        
+        # Players at the same place often send equivalent directions at
+        # once; share one model call between them instead of one each
+        key = (tuple(sorted(available_exits)), normalize_direction(player_direction))
+        in_flight = _EXIT_MATCHES_IN_FLIGHT.get(key)
+        if in_flight is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # Only this caller's own cancellation propagates; if the
+                # leading request was cancelled, ask the model directly
+                if not in_flight.cancelled():
+                    raise
+                return await self._ask_exit_match(player_direction, available_exits)
+        
+        future = asyncio.get_running_loop().create_future()
+        _EXIT_MATCHES_IN_FLIGHT[key] = future
+        try:
+            matched = await self._ask_exit_match(player_direction, available_exits)
+            future.set_result(matched)
+            return matched
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve it so a failure no follower awaited is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            del _EXIT_MATCHES_IN_FLIGHT[key]
+            if not future.done():
+                future.cancel()
+    
+    async def _ask_exit_match(self, player_direction: str, available_exits: list[str]) -> Optional[str]:
+        """
+        Ask the model which exit a direction refers to, caching the answer.
+        
+        Args:
+            player_direction: What the player said
+            available_exits: List of actual exit names
+            
+        Returns:
+            The matched exit name, or None if no match
+        """
+        
+        cache = get_exit_match_cache()
+        
         # Use AI for semantic matching
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.1,
-            max_tokens=256
-        )
+        model = get_bedrock_model(temperature=0.1, max_tokens=32)
         
         prompt = f"""Match the player's direction to one of the available exits.
 
@@ -175,17 +500,23 @@ Do not include any explanation or extra text."""
         agent = Agent(model=model)
         
         try:
-            response = agent(prompt)
+            # Run in the Bedrock pool so the call does not block the event loop
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_BEDROCK_EXECUTOR, agent, prompt)
             matched = str(response).strip()
             
             # Check if the response is one of the available exits
+            result = None
             for exit_name in available_exits:
                 if exit_name.lower() in matched.lower() or matched.lower() in exit_name.lower():
-                    return exit_name
+                    result = exit_name
+                    break
             
-            return None
+            cache.put(player_direction, available_exits, result)
+            return result
         except Exception:
-            # Fallback: try simple substring matching
+            # Fallback: try simple substring matching (not cached, so the
+            # AI is consulted again once it is reachable)
             for exit_name in available_exits:
                 if player_direction.lower() in exit_name.lower():
                     return exit_name
@@ -203,10 +534,6 @@ Do not include any explanation or extra text."""
         Returns:
             ActionResult with item added to inventory
         """
-        import os
-        from strands import Agent
-        from strands.models import BedrockModel
-        from backend.models.game_state import Item
         
         current_location = self.game_state.visited_locations.get(
             self.game_state.player_location
@@ -220,14 +547,14 @@ Do not include any explanation or extra text."""
         
         # First check if item is in the items array (structured data)
         item_to_take = None
+        wanted = item_name.casefold()
         for item in current_location.items:
-            if item_name.lower() in item.name.lower() or item.name.lower() in item_name.lower():
+            name = item.name.casefold()
+            if wanted in name or name in wanted:
                 item_to_take = item
                 break
         
         if item_to_take:
-            # Import here to avoid circular dependency
-            from backend.services.door_handlers import DoorHandlers
             
             # Special handling for keys
             if item_to_take.is_key and item_to_take.door_number:
@@ -238,58 +565,45 @@ Do not include any explanation or extra text."""
             return ActionResult(
                 success=True,
                 message=f"You take the {item_to_take.name}.",
-                items_added=[item_to_take],
+                items_added=(item_to_take,),
                 state_changes={'item_taken': item_to_take.id}
             )
         
         # Item not in array - use AI to determine if it can be taken from description
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.3,
-            max_tokens=512
-        )
+        model = get_bedrock_model(temperature=0.3, max_tokens=150, cache_prompt=True)
         
         system_prompt = f"""You are the game master for Nature42. Determine if the player can take an item.
 
 CURRENT LOCATION:
 {current_location.description}
 
-The player wants to take: {item_name}
-
-Respond with JSON in this format:
-{{
-    "can_take": true/false,
-    "item_name": "exact name of item",
-    "message": "response to player",
-    "is_key": true/false
-}}
-
+Answer by calling the take_item_decision tool.
 If the item is mentioned in the description and could reasonably be picked up, set can_take to true.
 If it's the key for this world, set is_key to true."""
 
-        agent = Agent(model=model, system_prompt=system_prompt)
+        # Forcing the tool call makes Bedrock return the decision as parsed
+        # JSON input, with no preamble or fenced text to strip
+        request = model.format_request(
+            messages=[{"role": "user", "content": [{"text": f"Can player take: {item_name}?"}]}],
+            system_prompt=system_prompt
+        )
+        request["toolConfig"] = {
+            "tools": [{"toolSpec": _TAKE_ITEM_TOOL}],
+            "toolChoice": {"tool": {"name": _TAKE_ITEM_TOOL["name"]}}
+        }
         
         try:
-            # Run synchronously in executor
-            import asyncio
-            import json
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
-                None,
-                lambda: agent(f"Can player take: {item_name}?")
+                _BEDROCK_EXECUTOR,
+                partial(model.client.converse, **request)
             )
             
-            response_text = str(response).strip()
-            # Extract JSON
-            if "```" in response_text:
-                lines = response_text.split("\n")
-                response_text = "\n".join([l for l in lines if not l.strip().startswith("```")])
-            
-            result = json.loads(response_text)
+            result = next(
+                block["toolUse"]["input"]
+                for block in response["output"]["message"]["content"]
+                if "toolUse" in block
+            )
             
             if result.get("can_take"):
                 # Create item and add to inventory
@@ -303,14 +617,13 @@ If it's the key for this world, set is_key to true."""
                 
                 # If it's a key, use special handler
                 if new_item.is_key and new_item.door_number:
-                    from backend.services.door_handlers import DoorHandlers
                     door_handlers = DoorHandlers(self.game_state)
                     return await door_handlers.handle_retrieve_key(new_item.door_number)
                 
                 return ActionResult(
                     success=True,
                     message=result.get("message", f"You take the {new_item.name}."),
-                    items_added=[new_item],
+                    items_added=(new_item,),
                     state_changes={'item_taken': new_item.id}
                 )
             else:
@@ -319,6 +632,7 @@ If it's the key for this world, set is_key to true."""
                     message=result.get("message", f"There is no {item_name} here.")
                 )
         except Exception as e:
+            logger.error(f"Error in handle_take_item: {e}", exc_info=True)
             # Fallback
             return ActionResult(
                 success=False,
@@ -341,16 +655,20 @@ If it's the key for this world, set is_key to true."""
         item_to_drop = None
         item_name_lower = item_name.lower()
         
+        # Lowercase each inventory name once for both passes
+        lowered = [(item, item.name.lower()) for item in self.game_state.inventory]
+        
         # First try exact match
-        for item in self.game_state.inventory:
-            if item.name.lower() == item_name_lower:
+        for item, name_lower in lowered:
+            if name_lower == item_name_lower:
                 item_to_drop = item
                 break
         
         # Then try partial match
         if not item_to_drop:
-            for item in self.game_state.inventory:
-                if item_name_lower in item.name.lower() or any(word in item.name.lower() for word in item_name_lower.split()):
+            words = item_name_lower.split()
+            for item, name_lower in lowered:
+                if item_name_lower in name_lower or any(word in name_lower for word in words):
                     item_to_drop = item
                     break
         
@@ -364,7 +682,7 @@ If it's the key for this world, set is_key to true."""
         return ActionResult(
             success=True,
             message=f"You drop the {item_to_drop.name}.",
-            items_removed=[item_to_drop]
+            items_removed=(item_to_drop,)
         )
     
     async def handle_inventory(self) -> ActionResult:
@@ -402,9 +720,6 @@ If it's the key for this world, set is_key to true."""
         Returns:
             ActionResult with success status and message
         """
-        import os
-        from strands import Agent
-        from strands.models import BedrockModel
         
         if not self.game_state.inventory:
             return ActionResult(
@@ -421,15 +736,7 @@ If it's the key for this world, set is_key to true."""
         inventory_list = "\n".join([f"- {item.name}: {item.description}" for item in self.game_state.inventory])
         
         # Use AI to match item and determine usage
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.7,
-            max_tokens=1024
-        )
+        model = get_bedrock_model(temperature=0.7, max_tokens=1024, cache_prompt=True)
         
         location_desc = current_location.description if current_location else "Unknown location"
         
@@ -438,16 +745,7 @@ If it's the key for this world, set is_key to true."""
 CURRENT LOCATION:
 {location_desc}
 
-PLAYER'S INVENTORY:
-{inventory_list}
-
-GAME CONTEXT:
-- Keys collected: {len(self.game_state.keys_collected)}/6
-- Current door: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
-
-The player wants to use: "{item_name}"
-
-Match this to an item in their inventory (use semantic understanding - "watch" matches "Giant Neon Swatch Watch").
+Match the item the player names to an item in their inventory (use semantic understanding - "watch" matches "Giant Neon Swatch Watch").
 Then describe what happens when they use it in this context.
 
 If it's a key, remind them to insert it into the vault instead.
@@ -462,17 +760,22 @@ Respond with JSON in this format:
 
 Set key_found to true ONLY if using this item directly reveals or obtains the key for this door world."""
 
+        # Per-turn context goes in the message so the system prompt stays cacheable
+        prompt = f"""PLAYER'S INVENTORY:
+{inventory_list}
+
+GAME CONTEXT:
+- Keys collected: {len(self.game_state.keys_collected)}/6
+- Current door: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
+
+The player wants to use: "{item_name}"."""
+
         agent = Agent(model=model, system_prompt=system_prompt)
         
         try:
             # Run synchronously in executor
-            import asyncio
-            import json
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: agent(f"Player uses: {item_name}")
-            )
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_BEDROCK_EXECUTOR, agent, prompt)
             
             response_text = str(response).strip()
             
@@ -492,7 +795,6 @@ Set key_found to true ONLY if using this item directly reveals or obtains the ke
             
             # If key was found, trigger retrieval
             if key_found and self.game_state.current_door and self.game_state.current_door not in self.game_state.keys_collected:
-                from backend.services.door_handlers import DoorHandlers
                 door_handlers = DoorHandlers(self.game_state)
                 key_result = await door_handlers.handle_retrieve_key(self.game_state.current_door)
                 
@@ -526,9 +828,6 @@ Set key_found to true ONLY if using this item directly reveals or obtains the ke
         Simplified approach: Let AI generate examination responses based on
         the location description and what the player wants to examine.
         """
-        import os
-        from strands import Agent
-        from strands.models import BedrockModel
         
         # Get current location
         current_location = self.game_state.visited_locations.get(
@@ -542,7 +841,8 @@ Set key_found to true ONLY if using this item directly reveals or obtains the ke
             )
         
         # Handle examining the area/room/surroundings as examining the location
-        if not target or target.lower() in ["area", "room", "surroundings", "location", "here"]:
+        target_lower = target.lower() if target else ""
+        if not target or target_lower in _SURROUNDINGS_TARGETS:
             # Examine current location
             current_location = self.game_state.visited_locations.get(
                 self.game_state.player_location
@@ -557,10 +857,12 @@ Set key_found to true ONLY if using this item directly reveals or obtains the ke
                 message="You look around but see nothing special."
             )
         
+        # One pass finds every routing keyword in the target
+        keywords = _EXAMINE_KEYWORDS_RE.findall(target_lower)
+        
         # Special handling for vault examination (Requirement 13.2)
-        if "vault" in target.lower():
+        if "vault" in keywords:
             if self.game_state.player_location == "forest_clearing":
-                from backend.services.forest_clearing import get_vault_description
                 vault_desc = get_vault_description(len(self.game_state.keys_collected))
                 return ActionResult(
                     success=True,
@@ -573,19 +875,16 @@ Set key_found to true ONLY if using this item directly reveals or obtains the ke
                 )
         
         # Special handling for door examination
-        if "door" in target.lower():
+        if "door" in keywords:
             if self.game_state.player_location == "forest_clearing":
-                # Extract door number
-                door_number = None
-                number_words = ["one", "two", "three", "four", "five", "six"]
-                
-                for i in range(1, 7):
-                    if str(i) in target or number_words[i-1] in target.lower():
-                        door_number = i
-                        break
+                # Extract door number (the lowest mentioned, if several)
+                door_numbers = [
+                    _DOOR_NUMBER_TOKENS[keyword] for keyword in keywords
+                    if keyword in _DOOR_NUMBER_TOKENS
+                ]
+                door_number = min(door_numbers) if door_numbers else None
                 
                 if door_number:
-                    from backend.services.forest_clearing import get_door_description
                     has_key = door_number in self.game_state.keys_collected
                     door_desc = get_door_description(door_number, has_key)
                     return ActionResult(
@@ -603,42 +902,51 @@ Set key_found to true ONLY if using this item directly reveals or obtains the ke
                     message="There are no numbered doors here. The six doors are in the forest clearing."
                 )
         
+        # The same question against unchanged state gets the recent answer
+        cache_key = self._narration_key("examine", target, current_location.description)
+        cached = _NARRATION_CACHE.get(cache_key)
+        if cached is not None:
+            return ActionResult(success=True, message=cached)
+        
         # Use AI to examine specific target based on location description
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.7,
-            max_tokens=512
-        )
+        model = get_bedrock_model(temperature=0.7, max_tokens=512, cache_prompt=True)
         
         system_prompt = f"""You are the game master for Nature42. The player wants to examine something.
 
 CURRENT LOCATION:
 {current_location.description}
 
-GAME CONTEXT:
-- Keys collected: {len(self.game_state.keys_collected)}/6
-- Current door: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
-
 Generate a detailed examination response for what the player is looking at.
 Be descriptive and provide hints if the object is important for finding the key.
 Keep responses concise (1-2 paragraphs)."""
 
+        # Per-turn context goes in the message so the system prompt stays cacheable
+        prompt = f"""GAME CONTEXT:
+- Keys collected: {len(self.game_state.keys_collected)}/6
+- Current door: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
+
+Player examines: {target}"""
+
+        if self.stream_text:
+            return ActionResult(
+                success=True,
+                message="",
+                message_stream=_stream_agent_text(
+                    model, system_prompt, prompt,
+                    fallback=f"You examine the {target}. It looks interesting.",
+                    on_complete=partial(_NARRATION_CACHE.put, cache_key)
+                )
+            )
+        
         agent = Agent(model=model, system_prompt=system_prompt)
         
         try:
             # Run synchronously in executor
-            import asyncio
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: agent(f"Player examines: {target}")
-            )
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_BEDROCK_EXECUTOR, agent, prompt)
             
             examination = str(response).strip()
+            _NARRATION_CACHE.put(cache_key, examination)
             
             return ActionResult(
                 success=True,
@@ -696,9 +1004,6 @@ Your goal: Collect all six keys from the six door worlds and unlock the vault.""
         Returns:
             ActionResult with contextual hint
         """
-        import os
-        from strands import Agent
-        from strands.models import BedrockModel
         
         # Get current location
         current_location = self.game_state.visited_locations.get(
@@ -714,30 +1019,20 @@ Your goal: Collect all six keys from the six door worlds and unlock the vault.""
             recent_decisions = self.game_state.decision_history[-3:]
             recent_context = "\n\nRecent actions:\n" + "\n".join([f"- {d.description}" for d in recent_decisions])
         
+        # The same question against unchanged state gets the recent answer
+        cache_key = self._narration_key("hint", None, location_desc)
+        cached = _NARRATION_CACHE.get(cache_key)
+        if cached is not None:
+            return ActionResult(success=True, message=cached)
+        
         # Use AI to generate contextual hint
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.7,
-            max_tokens=512
-        )
+        model = get_bedrock_model(temperature=0.7, max_tokens=180, cache_prompt=True)
         
         system_prompt = f"""You are the game master for Nature42. Provide a helpful hint.
 
 CURRENT LOCATION:
 {location_desc}
 
-PLAYER'S INVENTORY:
-{inventory_list}
-
-GAME PROGRESS:
-- Keys collected: {len(self.game_state.keys_collected)}/6
-- Current door world: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
-{recent_context}
-
 Provide a contextual hint that:
 1. Acknowledges what the player has done
 2. Suggests a specific next step based on the current situation
@@ -746,18 +1041,37 @@ Provide a contextual hint that:
 
 Keep it concise (2-3 sentences) and helpful."""
 
+        # Per-turn context goes in the message so the system prompt stays cacheable
+        prompt = f"""PLAYER'S INVENTORY:
+{inventory_list}
+
+GAME PROGRESS:
+- Keys collected: {len(self.game_state.keys_collected)}/6
+- Current door world: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
+{recent_context}
+
+Give the player a helpful hint"""
+
+        if self.stream_text:
+            return ActionResult(
+                success=True,
+                message="",
+                message_stream=_stream_agent_text(
+                    model, system_prompt, prompt,
+                    fallback="Try examining objects around you, talking to NPCs, or exploring different areas. The key is hidden somewhere in this world!",
+                    on_complete=partial(_NARRATION_CACHE.put, cache_key)
+                )
+            )
+        
         agent = Agent(model=model, system_prompt=system_prompt)
         
         try:
             # Run synchronously in executor
-            import asyncio
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: agent("Give the player a helpful hint")
-            )
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_BEDROCK_EXECUTOR, agent, prompt)
             
             hint = str(response).strip()
+            _NARRATION_CACHE.put(cache_key, hint)
             
             return ActionResult(
                 success=True,
@@ -775,7 +1089,11 @@ Keep it concise (2-3 sentences) and helpful."""
         Handle talking to NPCs using simple AI-generated dialogue.
         
         Simplified approach: Just use AI to generate a response based on the
-        location description and what the player said.
+        location description and what the player said. When the target
+        names one of the location's NPCs (see _match_npc_locally), it is
+        replaced by that NPC's name, so the dialogue addresses that NPC and
+        different phrasings for the same NPC share cached responses. Other
+        targets are used as the player wrote them, without a model call.
         
         Args:
             npc_target: The NPC the player wants to talk to (may be natural language)
@@ -783,9 +1101,6 @@ Keep it concise (2-3 sentences) and helpful."""
         Returns:
             ActionResult with NPC dialogue
         """
-        import os
-        from strands import Agent
-        from strands.models import BedrockModel
         
         # Get current location
         current_location = self.game_state.visited_locations.get(
@@ -798,42 +1113,54 @@ Keep it concise (2-3 sentences) and helpful."""
                 message="There's no one here to talk to."
             )
         
+        # Address the listed NPC the player means, if one matches locally
+        npc_target = _match_npc_locally(npc_target, current_location.npcs) or npc_target
+        
+        # The same question against unchanged state gets the recent answer
+        cache_key = self._narration_key("talk", npc_target, current_location.description)
+        cached = _NARRATION_CACHE.get(cache_key)
+        if cached is not None:
+            return ActionResult(success=True, message=cached)
+        
         # Simple AI call to generate dialogue
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.7,
-            max_tokens=1024
-        )
+        model = get_bedrock_model(temperature=0.7, max_tokens=1024, cache_prompt=True)
         
         system_prompt = f"""You are the game master for Nature42. The player wants to talk to someone.
 
 CURRENT LOCATION:
 {current_location.description}
 
-GAME CONTEXT:
-- Keys collected: {len(self.game_state.keys_collected)}/6
-- Current door: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
-
 Generate a natural, in-character response from the NPC the player is trying to talk to.
 Be helpful, stay in character, and provide hints if appropriate.
 Keep responses concise (2-3 paragraphs max)."""
 
+        # Per-turn context goes in the message so the system prompt stays cacheable
+        prompt = f"""GAME CONTEXT:
+- Keys collected: {len(self.game_state.keys_collected)}/6
+- Current door: {self.game_state.current_door if self.game_state.current_door else "Forest Clearing"}
+
+Player says: talk to {npc_target}"""
+
+        if self.stream_text:
+            return ActionResult(
+                success=True,
+                message="",
+                message_stream=_stream_agent_text(
+                    model, system_prompt, prompt,
+                    fallback=f"You try to talk to {npc_target}, but they seem preoccupied at the moment.",
+                    on_complete=partial(_NARRATION_CACHE.put, cache_key)
+                )
+            )
+        
         agent = Agent(model=model, system_prompt=system_prompt)
         
         try:
             # Run synchronously in executor
-            import asyncio
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: agent(f"Player says: talk to {npc_target}")
-            )
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_BEDROCK_EXECUTOR, agent, prompt)
             
             dialogue = str(response).strip()
+            _NARRATION_CACHE.put(cache_key, dialogue)
             
             return ActionResult(
                 success=True,
@@ -841,9 +1168,7 @@ Keep responses concise (2-3 paragraphs max)."""
             )
         except Exception as e:
             # Log the error for debugging
-            import traceback
-            print(f"Error in handle_talk: {e}")
-            print(traceback.format_exc())
+            logger.error(f"Error in handle_talk: {e}", exc_info=True)
             
             # Fallback response
             return ActionResult(
@@ -862,62 +1187,57 @@ Keep responses concise (2-3 paragraphs max)."""
         Returns:
             The matched NPC name, or None if no match
         """
-        import os
-        import json
-        from strands import Agent
-        from strands.models import BedrockModel
         
-        # Quick exact match first
-        for npc_name in available_npcs:
-            if player_target.lower() == npc_name.lower():
-                return npc_name
+        player_target = player_target.strip()
+        if not available_npcs or not player_target:
+            return None
+        
+        # Local matches (exact name, name fragment, shared words) come first
+        matched = _match_npc_locally(player_target, available_npcs)
+        if matched is not None:
+            return matched
+        
+        # With a single NPC present, that is who the player is addressing
+        if len(available_npcs) == 1:
+            return available_npcs[0]
+        
+        npcs = tuple(available_npcs)
+        _, npc_words = _npc_index(npcs)
+        player_folded = player_target.casefold()
+        
+        # Targets the model has already resolved here are reused
+        cache = get_npc_match_cache()
+        cached = cache.get(player_target, available_npcs)
+        if cached is not MISS:
+            return cached
         
         # Use AI for semantic matching
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.1,
-            max_tokens=256
-        )
+        model = get_bedrock_model(temperature=0.1, max_tokens=16, cache_prompt=True)
         
-        prompt = f"""Match the player's target to one of the available NPCs.
-
-Player wants to talk to: "{player_target}"
+        prompt = f"""Player wants to talk to: "{player_target}"
 
 Available NPCs:
-{chr(10).join(f"- {npc}" for npc in available_npcs)}
-
-Respond with ONLY the exact NPC name that best matches what the player wants, or "NONE" if no match.
-Do not include any explanation or extra text.
-
-Examples:
-- "the squirrel" matches "A peculiar squirrel with intelligent eyes"
-- "rabbit" matches "Thumper the Wise Rabbit"
-- "keeper" matches "The Cabbage Patch Keeper"
-"""
+{_render_npc_list(npcs)}"""
 
-        agent = Agent(model=model)
+        agent = Agent(model=model, system_prompt=_NPC_MATCH_SYSTEM_PROMPT)
         
         try:
-            response = agent(prompt)
-            matched = str(response).strip()
+            # Run in the Bedrock pool so the call does not block the event loop
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_BEDROCK_EXECUTOR, agent, prompt)
+            number = _NPC_NUMBER_RE.search(str(response))
             
-            # Check if the response is one of the available NPCs
-            for npc_name in available_npcs:
-                if npc_name.lower() in matched.lower() or matched.lower() in npc_name.lower():
-                    return npc_name
+            # Map the NPC number back to its name (0 or out of range is no match)
+            index = int(number.group()) if number else 0
+            result = available_npcs[index - 1] if 1 <= index <= len(available_npcs) else None
             
-            return None
+            cache.put(player_target, available_npcs, result)
+            return result
         except Exception:
-            # Fallback: try simple substring matching
-            player_lower = player_target.lower()
-            for npc_name in available_npcs:
-                npc_lower = npc_name.lower()
-                # Check if any word from player_target is in the NPC name
-                for word in player_lower.split():
-                    if len(word) > 2 and word in npc_lower:
-                        return npc_name
+            # Fallback: the first NPC sharing a word with player_target
+            # (not cached, so the AI is consulted again once it is reachable)
+            player_words = frozenset(player_folded.split())
+            for npc_name, words in zip(npcs, npc_words):
+                if not words.isdisjoint(player_words):
+                    return npc_name
             return None
@@ -0,0 +1,97 @@
+"""
+Shared Bedrock model configuration for Nature42.
+
+Every AI call in the game goes through get_bedrock_model, so model ID,
+region, connection pooling, prompt caching and latency optimization are
+configured the same way everywhere.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+from botocore.config import Config as BotocoreConfig
+from strands.models import BedrockModel
+
+
+# Connection pool sized above the action handlers' Bedrock executor so
+# threads never wait on a connection; adaptive retries back off
+# client-side under throttling
+_BOTO_CONFIG = BotocoreConfig(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    retries={"mode": "adaptive", "max_attempts": 3}
+)
+
+# Bedrock model families that accept cachePoint blocks in the system prompt
+_PROMPT_CACHE_MODELS = (
+    "claude-3-5-haiku",
+    "claude-3-7-sonnet",
+    "claude-sonnet-4",
+    "claude-opus-4",
+    "nova",
+)
+
+
+def _prompt_cache_config(model_id: str) -> Dict[str, Any]:
+    """
+    Get BedrockModel settings that cache the system prompt, if supported.
+
+    Callers keep their system prompts stable (game master rules, parsing
+    rules, the location description) and send per-turn context in the
+    user message, so a cache point after the system prompt lets Bedrock
+    reuse the prefilled prefix on later turns.
+
+    Args:
+        model_id: Bedrock model ID
+
+    Returns:
+        Extra BedrockModel keyword arguments (empty if caching is disabled
+        via STRANDS_CACHE_PROMPT or unsupported by the model)
+    """
+    if os.getenv("STRANDS_CACHE_PROMPT", "true").lower() != "true":
+        return {}
+    if any(family in model_id for family in _PROMPT_CACHE_MODELS):
+        return {"cache_prompt": "default"}
+    return {}
+
+
+@lru_cache(maxsize=16)
+def get_bedrock_model(temperature: float, max_tokens: int, cache_prompt: bool = False) -> BedrockModel:
+    """
+    Get the shared Bedrock model for a configuration.
+
+    Models are created once per configuration and reused, so the boto3
+    client, its credentials and its pooled HTTPS connections stay warm
+    across commands. BedrockModel keeps no per-request state, which makes
+    it safe to share between threads and requests.
+
+    With STRANDS_LATENCY_OPTIMIZED=true, requests ask Bedrock for
+    latency-optimized inference. Bedrock does not combine that with prompt
+    caching, so calls that cache their system prompt use standard inference.
+
+    Args:
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        cache_prompt: Place a cache point after the system prompt, if supported
+
+    Returns:
+        Configured BedrockModel
+    """
+
+    model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
+    region_name = os.getenv("AWS_REGION", "us-east-1")
+
+    config = _prompt_cache_config(model_id) if cache_prompt else {}
+    if not config and os.getenv("STRANDS_LATENCY_OPTIMIZED", "false").lower() == "true":
+        config["additional_args"] = {"performanceConfig": {"latency": "optimized"}}
+
+    return BedrockModel(
+        model_id=model_id,
+        region_name=region_name,
+        boto_client_config=_BOTO_CONFIG,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **config
+    )
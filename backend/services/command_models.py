@@ -4,12 +4,12 @@ Command processing data models for Nature42.
 This module contains the data classes used throughout the command processing system.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 from backend.models.game_state import Item, Decision
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Intent:
     """
     Represents the parsed intent from a player command.
@@ -27,14 +27,10 @@ class Intent:
     is_ambiguous: bool = False
     is_invalid: bool = False
     clarification_needed: Optional[str] = None
-    suggestions: List[str] = None
-    
-    def __post_init__(self):
-        if self.suggestions is None:
-            self.suggestions = []
+    suggestions: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """
     Result of validating an action against game context.
@@ -46,14 +42,10 @@ class ValidationResult:
     """
     is_valid: bool
     reason: str
-    context_info: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.context_info is None:
-            self.context_info = {}
+    context_info: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """
     Result of executing an action.
@@ -66,25 +58,20 @@ class ActionResult:
         items_added: Items added to inventory
         items_removed: Items removed from inventory
         decision: Significant decision to record (if any)
+        message_stream: Text chunks of the message, still being generated
+            (message is empty when this is set)
     """
     success: bool
     message: str
-    state_changes: Dict[str, Any] = None
+    state_changes: Dict[str, Any] = field(default_factory=dict)
     new_location: Optional[str] = None
-    items_added: List[Item] = None
-    items_removed: List[Item] = None
+    items_added: Tuple[Item, ...] = ()
+    items_removed: Tuple[Item, ...] = ()
     decision: Optional[Decision] = None
-    
-    def __post_init__(self):
-        if self.state_changes is None:
-            self.state_changes = {}
-        if self.items_added is None:
-            self.items_added = []
-        if self.items_removed is None:
-            self.items_removed = []
+    message_stream: Optional[AsyncIterator[str]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     """
     Complete result of processing a command.
@@ -94,12 +81,11 @@ class CommandResult:
         message: Response message to player
         state_changes: Dictionary of state changes to apply
         needs_clarification: Whether the command needs clarification
+        message_stream: Text chunks of the message, still being generated
+            (message is empty when this is set)
     """
     success: bool
     message: str
-    state_changes: Dict[str, Any] = None
+    state_changes: Dict[str, Any] = field(default_factory=dict)
     needs_clarification: bool = False
-    
-    def __post_init__(self):
-        if self.state_changes is None:
-            self.state_changes = {}
+    message_stream: Optional[AsyncIterator[str]] = None
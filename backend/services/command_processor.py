@@ -5,17 +5,16 @@ This module coordinates command parsing, validation, and execution by delegating
 to specialized handler modules.
 """
 
-import os
 import json
 from typing import Dict, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 from strands import Agent
-from strands.models import BedrockModel
 
 from backend.models.game_state import GameState, Decision, LocationData
 from backend.services.command_models import Intent, ValidationResult, ActionResult, CommandResult
 from backend.services.action_handlers import ActionHandlers
+from backend.services.bedrock import get_bedrock_model
 from backend.services.door_handlers import DoorHandlers
 
 # Load environment variables from .env file
@@ -24,6 +23,59 @@ load_dotenv()
 # Re-export models for backward compatibility
 __all__ = ['CommandProcessor', 'Intent', 'ValidationResult', 'ActionResult', 'CommandResult']
 
+# Instructions for the conversation agent that parses commands. They are
+# the same on every turn, so they form the cacheable system prompt and
+# each turn sends only the player's command.
+_PARSER_SYSTEM_PROMPT = """You are a command parser for a text adventure game called Nature42.
+
+Your job is to parse player commands and maintain conversation context. You remember previous 
+interactions, so when a player says "yes" or "that one", you can refer back to what was 
+discussed earlier.
+
+When parsing commands, always respond with valid JSON containing the action and target.
+Be helpful and conversational when the player needs clarification.
+
+For each player's command, extract:
+1. The primary action (move, take, examine, use, talk, open, insert, etc.)
+2. The target of the action (if any)
+3. Whether the command is ambiguous and needs clarification
+4. Whether the command is invalid/nonsensical
+
+Common actions:
+- Movement: go, move, walk, travel, enter, exit
+- Interaction: take, get, pick up, drop, put down, use, examine, look at, inspect
+- Communication: talk to, speak with, ask, tell, say hello
+- Game mechanics: open door, insert key, check inventory, new game, start over
+- Help: help, ?, what do i do, how do i play, what can i do
+- Hint: hint, give me a hint, i'm stuck, clue
+
+IMPORTANT PARSING RULES:
+- For general help about commands, use action "help"
+- For hints about progressing in the game, use action "hint"
+- For starting a new game, use action "new_game"
+- Convert ordinal numbers to digits: "first" -> "1", "second" -> "2", "third" -> "3", etc.
+- For door references, extract the number: "the first door" -> "door 1", "door number 3" -> "door 3"
+- Simplify natural language: "the squirrel" -> "squirrel", "that rabbit" -> "rabbit"
+
+You MUST respond with ONLY valid JSON in this exact format:
+{
+    "action": "primary_action",
+    "target": "target_object_or_direction",
+    "is_ambiguous": false,
+    "is_invalid": false,
+    "clarification_needed": null,
+    "suggestions": []
+}
+
+Examples:
+- "go north" -> {"action": "move", "target": "north", "is_ambiguous": false, "is_invalid": false}
+- "take the key" -> {"action": "take", "target": "key", "is_ambiguous": false, "is_invalid": false}
+- "open the first door" -> {"action": "open", "target": "door 1", "is_ambiguous": false, "is_invalid": false}
+- "talk to the squirrel" -> {"action": "talk", "target": "squirrel", "is_ambiguous": false, "is_invalid": false}
+- "head down the path with the bridge" -> {"action": "move", "target": "path with bridge", "is_ambiguous": false, "is_invalid": false}
+- "use it" -> {"action": "use", "target": null, "is_ambiguous": true, "clarification_needed": "What would you like to use?"}
+- "fly to the moon" -> {"action": "fly", "target": "moon", "is_invalid": true, "suggestions": ["go north", "go south", "examine area"]}"""
+
 
 class CommandProcessor:
     """
@@ -33,48 +85,33 @@ class CommandProcessor:
     game context, and routes to appropriate handlers for execution.
     """
     
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, stream_text: bool = False):
         """
         Initialize command processor with game state.
         
         Args:
             game_state: Current game state
+            stream_text: Let narrative actions return their message as a
+                message_stream (see ActionHandlers)
         """
         self.game_state = game_state
         
         # Initialize handlers
-        self.action_handlers = ActionHandlers(game_state)
+        self.action_handlers = ActionHandlers(game_state, stream_text=stream_text)
         self.door_handlers = DoorHandlers(game_state)
         
-        # Get model configuration from environment variables
-        model_id = os.getenv("STRANDS_MODEL_ID", "anthropic.claude-sonnet-4-20250514-v1:0")
-        region_name = os.getenv("AWS_REGION", "us-east-1")
-        
-        # Create Bedrock model for command parsing
+        # Shared Bedrock model for command parsing, with a cache point after
+        # the fixed system prompt (see get_bedrock_model)
         # Use lower temperature for more consistent parsing
-        self.model = BedrockModel(
-            model_id=model_id,
-            region_name=region_name,
-            temperature=0.3,  # Lower temperature for more consistent parsing
-            max_tokens=2048
-        )
+        self.model = get_bedrock_model(temperature=0.3, max_tokens=2048, cache_prompt=True)
         
         # Create a persistent agent for conversation management
         # This agent maintains conversation history across commands
         from strands.agent.conversation_manager import SlidingWindowConversationManager
         
-        system_prompt = """You are a command parser for a text adventure game called Nature42.
-
-Your job is to parse player commands and maintain conversation context. You remember previous 
-interactions, so when a player says "yes" or "that one", you can refer back to what was 
-discussed earlier.
-
-When parsing commands, always respond with valid JSON containing the action and target.
-Be helpful and conversational when the player needs clarification."""
-        
         self.conversation_agent = Agent(
             model=self.model,
-            system_prompt=system_prompt,
+            system_prompt=_PARSER_SYSTEM_PROMPT,
             conversation_manager=SlidingWindowConversationManager(
                 window_size=20  # Keep last 20 messages for context
             )
@@ -215,12 +252,11 @@ This lets you test the full key retrieval → teleportation → insertion flow!"
         
         # Remove items from inventory
         if 'items_removed' in state_changes:
-            for item_dict in state_changes['items_removed']:
-                item_id = item_dict.get('id')
-                self.game_state.inventory = [
-                    item for item in self.game_state.inventory 
-                    if item.id != item_id
-                ]
+            removed_ids = {item_dict.get('id') for item_dict in state_changes['items_removed']}
+            self.game_state.inventory = [
+                item for item in self.game_state.inventory 
+                if item.id not in removed_ids
+            ]
         
         # Record decision in history (Requirement 10.5)
         if 'decision' in state_changes:
@@ -420,7 +456,8 @@ This lets you test the full key retrieval → teleportation → insertion flow!"
         return CommandResult(
             success=action_result.success,
             message=action_result.message,
-            state_changes=state_changes
+            state_changes=state_changes,
+            message_stream=action_result.message_stream
         )
     
     def _parse_intent_sync(self, command: str) -> Intent:
@@ -439,50 +476,9 @@ This lets you test the full key retrieval → teleportation → insertion flow!"
         Returns:
             Intent object with parsed action and target
         """
-        # Build the parsing instruction as a user message
-        # The system prompt is set once on the persistent agent
-        parsing_instruction = f"""Parse the player's command and extract:
-1. The primary action (move, take, examine, use, talk, open, insert, etc.)
-2. The target of the action (if any)
-3. Whether the command is ambiguous and needs clarification
-4. Whether the command is invalid/nonsensical
-
-Common actions:
-- Movement: go, move, walk, travel, enter, exit
-- Interaction: take, get, pick up, drop, put down, use, examine, look at, inspect
-- Communication: talk to, speak with, ask, tell, say hello
-- Game mechanics: open door, insert key, check inventory, new game, start over
-- Help: help, ?, what do i do, how do i play, what can i do
-- Hint: hint, give me a hint, i'm stuck, clue
-
-IMPORTANT PARSING RULES:
-- For general help about commands, use action "help"
-- For hints about progressing in the game, use action "hint"
-- For starting a new game, use action "new_game"
-- Convert ordinal numbers to digits: "first" -> "1", "second" -> "2", "third" -> "3", etc.
-- For door references, extract the number: "the first door" -> "door 1", "door number 3" -> "door 3"
-- Simplify natural language: "the squirrel" -> "squirrel", "that rabbit" -> "rabbit"
-
-You MUST respond with ONLY valid JSON in this exact format:
-{{
-    "action": "primary_action",
-    "target": "target_object_or_direction",
-    "is_ambiguous": false,
-    "is_invalid": false,
-    "clarification_needed": null,
-    "suggestions": []
-}}
-
-Examples:
-- "go north" -> {{"action": "move", "target": "north", "is_ambiguous": false, "is_invalid": false}}
-- "take the key" -> {{"action": "take", "target": "key", "is_ambiguous": false, "is_invalid": false}}
-- "open the first door" -> {{"action": "open", "target": "door 1", "is_ambiguous": false, "is_invalid": false}}
-- "talk to the squirrel" -> {{"action": "talk", "target": "squirrel", "is_ambiguous": false, "is_invalid": false}}
-- "head down the path with the bridge" -> {{"action": "move", "target": "path with bridge", "is_ambiguous": false, "is_invalid": false}}
-- "use it" -> {{"action": "use", "target": null, "is_ambiguous": true, "clarification_needed": "What would you like to use?"}}
-- "fly to the moon" -> {{"action": "fly", "target": "moon", "is_invalid": true, "suggestions": ["go north", "go south", "examine area"]}}
-
-Player's command: {command}"""
+        # The parsing rules live in the cached system prompt; only the
+        # command itself is sent each turn
+        parsing_instruction = f"Player's command: {command}"
         
         try:
             # Use the persistent conversation agent to maintain context
@@ -505,7 +501,7 @@ Player's command: {command}"""
                 is_ambiguous=intent_data.get("is_ambiguous", False),
                 is_invalid=intent_data.get("is_invalid", False),
                 clarification_needed=intent_data.get("clarification_needed"),
-                suggestions=intent_data.get("suggestions", [])
+                suggestions=tuple(intent_data.get("suggestions") or ())
             )
             
         except (json.JSONDecodeError, KeyError) as e:
@@ -513,7 +509,7 @@ Player's command: {command}"""
             return Intent(
                 action="unknown",
                 is_invalid=True,
-                suggestions=["try 'go [direction]'", "try 'examine [object]'", "try 'take [item]'"]
+                suggestions=("try 'go [direction]'", "try 'examine [object]'", "try 'take [item]'")
             )
     
     async def _validate_action(self, intent: Intent) -> ValidationResult:
@@ -29,6 +29,9 @@ from backend.utils.error_handling import (
     logger
 )
 
+# Number of most recent decisions that shape a generated location
+PLAYER_HISTORY_WINDOW = 5
+
 
 class ContentGenerator:
     """
@@ -166,7 +169,8 @@ CONTENT GUIDELINES (Age 13+):
         
         Args:
             door_number: Which door (1-6) this location is behind
-            player_history: Player's decision history
+            player_history: Player's decision history (only the last
+                PLAYER_HISTORY_WINDOW entries are used)
             keys_collected: Number of keys already collected
             location_id: Optional specific location ID (for caching)
             
@@ -195,7 +199,7 @@ CONTENT GUIDELINES (Age 13+):
         if player_history:
             history_context = "\n\nPLAYER HISTORY (use to adapt content):\n"
             # Include recent significant decisions
-            recent_decisions = player_history[-5:] if len(player_history) > 5 else player_history
+            recent_decisions = player_history[-PLAYER_HISTORY_WINDOW:]
             for decision in recent_decisions:
                 desc = decision.get('description', 'Unknown action')
                 consequences = decision.get('consequences', [])
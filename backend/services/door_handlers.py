@@ -79,7 +79,7 @@ class DoorHandlers:
             )
         
         # Generate new world for this door
-        from backend.services.content_generator import ContentGenerator
+        from backend.services.content_generator import ContentGenerator, PLAYER_HISTORY_WINDOW
         import asyncio
         
         generator = ContentGenerator()
@@ -90,7 +90,11 @@ class DoorHandlers:
             loop = asyncio.get_event_loop()
             location = await generator.generate_location(
                 door_number=door_number,
-                player_history=[d.to_dict() for d in self.game_state.decision_history],
+                # Only the recent decisions are used, so only those are converted
+                player_history=[
+                    d.to_dict()
+                    for d in self.game_state.decision_history[-PLAYER_HISTORY_WINDOW:]
+                ],
                 keys_collected=len(self.game_state.keys_collected),
                 location_id=door_world_key
             )
@@ -200,7 +204,7 @@ You find yourself back in the forest clearing. The six doors stand before you, a
         return ActionResult(
             success=True,
             message=message,
-            items_added=[key_item],
+            items_added=(key_item,),
             new_location="forest_clearing",
             state_changes={
                 'key_retrieved': door_number,
@@ -266,7 +270,7 @@ Congratulations! You've completed Nature42 and discovered the meaning of 42."""
             return ActionResult(
                 success=True,
                 message=vault_message,
-                items_removed=keys_to_insert,
+                items_removed=tuple(keys_to_insert),
                 state_changes=state_changes
             )
         else:
@@ -282,6 +286,6 @@ Congratulations! You've completed Nature42 and discovered the meaning of 42."""
             return ActionResult(
                 success=True,
                 message=message,
-                items_removed=keys_to_insert,
+                items_removed=tuple(keys_to_insert),
                 state_changes=state_changes
             )
@@ -0,0 +1,249 @@
+"""
+Local exit and NPC matching for Nature42.
+
+Resolves player directions to exit names, and talk targets to NPC names,
+without an AI round-trip where possible:
+
+- match_exit_locally and match_npc_locally pick a name when the player's
+  words clearly point at exactly one of them
+- MatchCache remembers which name earlier phrasings resolved to, by the
+  lowercased phrasing and by its content words (so "go north", "head
+  north" and "north" share an entry); one instance serves exits and
+  another NPCs
+"""
+
+import re
+from difflib import get_close_matches
+from typing import Callable, FrozenSet, Optional, Sequence, Tuple
+
+from backend.utils.cache import TTLCache
+
+# Words that carry no meaning about which exit the player wants. Spatial
+# prepositions ("up", "down", "through") are kept, since they can
+# distinguish exits.
+_DIRECTION_FILLER = frozenset({
+    "go", "head", "walk", "move", "run", "travel", "proceed", "continue",
+    "take", "follow", "wander", "step", "let's", "lets", "i", "want",
+    "to", "toward", "towards", "the", "a", "an", "please",
+})
+
+# Words that carry no meaning about which NPC the player is addressing
+_TARGET_FILLER = frozenset({
+    "talk", "speak", "chat", "ask", "say", "hello", "hi", "i", "want",
+    "to", "with", "the", "a", "an", "that", "this", "please",
+})
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Sentinel distinguishing a cache miss from a cached "no match" (None)
+MISS = object()
+
+
+def _content_words(text: str, filler: FrozenSet[str]) -> FrozenSet[str]:
+    """Lowercased words of text without filler, or all of them if only filler."""
+    words = _WORD_RE.findall(text.lower())
+    content = frozenset(word for word in words if word not in filler)
+    # A phrase made only of filler ("go up") is meaningful as-is
+    return content or frozenset(words)
+
+
+def normalize_direction(direction: str) -> FrozenSet[str]:
+    """
+    Reduce a direction to the set of words that identify an exit.
+
+    Args:
+        direction: What the player said (e.g., "head towards the old bridge")
+
+    Returns:
+        Content words of the direction (e.g., {"old", "bridge"})
+    """
+    return _content_words(direction, _DIRECTION_FILLER)
+
+
+def normalize_npc_target(target: str) -> FrozenSet[str]:
+    """
+    Reduce a talk target to the set of words that identify an NPC.
+
+    Args:
+        target: What the player said (e.g., "with the old squirrel")
+
+    Returns:
+        Content words of the target (e.g., {"old", "squirrel"})
+    """
+    return _content_words(target, _TARGET_FILLER)
+
+
+def _match_words(wanted: FrozenSet[str], names: Sequence[str]) -> Optional[str]:
+    """
+    Pick the name that covers the most of the wanted words.
+
+    Each name is scored by the fraction of the wanted words found in it,
+    allowing small misspellings and plurals. The best name is returned
+    only if it covers at least half of those words and no other name
+    scores as well.
+
+    Args:
+        wanted: Content words of what the player said
+        names: Candidate names
+
+    Returns:
+        The best matching name, or None if no name is a clear match
+    """
+    if not wanted:
+        return None
+
+    best_name = None
+    best_score = 0.0
+    tied = False
+    for name in names:
+        name_words = _WORD_RE.findall(name.lower())
+        hits = sum(
+            1 for word in wanted
+            if word in name_words or get_close_matches(word, name_words, n=1, cutoff=0.8)
+        )
+        score = hits / len(wanted)
+        if score > best_score:
+            best_name, best_score, tied = name, score, False
+        elif score == best_score and score > 0:
+            tied = True
+
+    if tied or best_score < 0.5:
+        return None
+    return best_name
+
+
+def match_exit_locally(player_direction: str, available_exits: Sequence[str]) -> Optional[str]:
+    """
+    Match a direction to an exit by the words they share.
+
+    Anything less clear-cut than one exit covering at least half of the
+    direction's content words is left to the AI matcher.
+
+    Args:
+        player_direction: What the player said (e.g., "cross the bridge")
+        available_exits: Exit names at the player's location
+
+    Returns:
+        The matched exit name, or None if no exit is a clear match
+    """
+    return _match_words(normalize_direction(player_direction), available_exits)
+
+
+def match_npc_locally(player_target: str, available_npcs: Sequence[str]) -> Optional[str]:
+    """
+    Match a talk target to an NPC by the words they share.
+
+    Args:
+        player_target: What the player said (e.g., "the squirrel")
+        available_npcs: NPC names at the player's location
+
+    Returns:
+        The matched NPC name, or None if no NPC is a clear match
+    """
+    return _match_words(normalize_npc_target(player_target), available_npcs)
+
+
+class MatchCache:
+    """
+    Two-tier cache of phrase-to-name matches.
+
+    Entries are keyed on the set of candidate names rather than the
+    location ID, since the names alone determine the answer and locations
+    with the same exits or NPCs can share results.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        normalize: Callable[[str], FrozenSet[str]] = normalize_direction
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum entries kept in each tier
+            normalize: Reduces a phrase to its content words for the
+                second tier
+        """
+        self._exact = TTLCache(maxsize, ttl=None)
+        self._normalized = TTLCache(maxsize, ttl=None)
+        self._normalize = normalize
+
+    @staticmethod
+    def _names_key(names: Sequence[str]) -> Tuple[str, ...]:
+        return tuple(sorted(names))
+
+    def get(self, query: str, names: Sequence[str]):
+        """
+        Look up a cached match.
+
+        Args:
+            query: What the player said
+            names: Candidate names at the player's location
+
+        Returns:
+            The matched name, None if the query was cached as matching no
+            name, or MISS if nothing is cached
+        """
+        names_key = self._names_key(names)
+        phrase = query.lower()
+
+        matched = self._exact.get((names_key, phrase), MISS)
+        if matched is not MISS:
+            return matched
+
+        matched = self._normalized.get((names_key, self._normalize(phrase)), MISS)
+        if matched is not MISS:
+            # Promote so the same phrasing hits the exact tier next time
+            self._exact.put((names_key, phrase), matched)
+        return matched
+
+    def put(self, query: str, names: Sequence[str], matched: Optional[str]) -> None:
+        """
+        Record the name a query resolved to.
+
+        Args:
+            query: What the player said
+            names: Candidate names at the player's location
+            matched: The matched name, or None for no match
+        """
+        names_key = self._names_key(names)
+        phrase = query.lower()
+        self._exact.put((names_key, phrase), matched)
+        self._normalized.put((names_key, self._normalize(phrase)), matched)
+
+    def clear(self) -> None:
+        """Remove all cached matches."""
+        self._exact.clear()
+        self._normalized.clear()
+
+
+# Global instances for the application
+_exit_match_cache: Optional[MatchCache] = None
+_npc_match_cache: Optional[MatchCache] = None
+
+
+def get_exit_match_cache() -> MatchCache:
+    """
+    Get the global cache of direction-to-exit matches.
+
+    Returns:
+        MatchCache singleton instance for exits
+    """
+    global _exit_match_cache
+    if _exit_match_cache is None:
+        _exit_match_cache = MatchCache(normalize=normalize_direction)
+    return _exit_match_cache
+
+
+def get_npc_match_cache() -> MatchCache:
+    """
+    Get the global cache of talk-target-to-NPC matches.
+
+    Returns:
+        MatchCache singleton instance for NPCs
+    """
+    global _npc_match_cache
+    if _npc_match_cache is None:
+        _npc_match_cache = MatchCache(normalize=normalize_npc_target)
+    return _npc_match_cache
@@ -7,11 +7,16 @@ Handles generation of shareable postcards and unique share codes.
 import secrets
 import string
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
+
+import orjson
 
 from backend.models.game_state import GameState, LocationData
 from backend.models.share import ShareablePostcard
 
+# Share code digits; codes are random integers rendered in this base
+_SHARE_CODE_ALPHABET = string.ascii_uppercase + string.digits
+
 
 class SharingService:
     """
@@ -25,6 +30,9 @@ class SharingService:
         """Initialize the sharing service with in-memory storage."""
         # In-memory storage for shares (in production, use database)
         self._shares: Dict[str, ShareablePostcard] = {}
+        # Encoded '"share_code":{postcard}' member per share, kept in step
+        # with _shares so listings never re-encode existing postcards
+        self._encoded_shares: Dict[str, bytes] = {}
     
     def generate_share_code(self, length: int = 8) -> str:
         """
@@ -39,11 +47,19 @@ class SharingService:
         Returns:
             Unique share code string
         """
-        alphabet = string.ascii_uppercase + string.digits
+        base = len(_SHARE_CODE_ALPHABET)
+        space = base ** length
         
         # Keep generating until we get a unique code
         while True:
-            code = ''.join(secrets.choice(alphabet) for _ in range(length))
+            # Draw the whole code as one random integer and render its
+            # digits, rather than drawing each character separately
+            value = secrets.randbelow(space)
+            digits = []
+            for _ in range(length):
+                value, digit = divmod(value, base)
+                digits.append(_SHARE_CODE_ALPHABET[digit])
+            code = ''.join(digits)
             if code not in self._shares:
                 return code
     
@@ -93,6 +109,9 @@ class SharingService:
         
         # Store the postcard
         self._shares[share_code] = postcard
+        self._encoded_shares[share_code] = (
+            orjson.dumps(share_code) + b":" + orjson.dumps(postcard)
+        )
         
         return postcard
     
@@ -117,6 +136,33 @@ class SharingService:
         """
         return self._shares.copy()
     
+    def share_count(self) -> int:
+        """
+        Get the number of stored shares.
+        
+        Returns:
+            Number of stored shares
+        """
+        return len(self._shares)
+    
+    def iter_shares_json(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Encode all stored shares as a JSON object, in chunks.
+        
+        Chunks are assembled from the per-share encodings, so streaming a
+        listing holds at most about chunk_size bytes beyond those. The set
+        of shares is fixed when this method is called, so it matches
+        share_count() taken at the same time.
+        
+        Args:
+            chunk_size: Approximate size of each yielded chunk in bytes
+            
+        Returns:
+            Iterator over consecutive pieces of the JSON object mapping
+            share codes to postcard dictionaries
+        """
+        return _join_json_members(list(self._encoded_shares.values()), chunk_size)
+    
     def delete_share(self, share_code: str) -> bool:
         """
         Delete a share by code.
@@ -129,10 +175,25 @@ class SharingService:
         """
         if share_code in self._shares:
             del self._shares[share_code]
+            del self._encoded_shares[share_code]
             return True
         return False
 
 
+def _join_json_members(members: List[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Yield a JSON object built from encoded members in ~chunk_size pieces."""
+    chunk = bytearray(b"{")
+    for i, member in enumerate(members):
+        if i:
+            chunk += b","
+        chunk += member
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+    chunk += b"}"
+    yield bytes(chunk)
+
+
 # Global instance for the application
 _sharing_service: Optional[SharingService] = None
 
@@ -7,7 +7,7 @@ Implements Task 13.1: Property-based testing with Hypothesis.
 
 import pytest
 from hypothesis import given, strategies as st, settings
-import json
+import orjson
 
 from backend.models.game_state import GameState, Item
 from backend.services.sharing import SharingService
@@ -33,17 +33,209 @@ def test_game_state_serialization_round_trip(keys_collected):
     state_dict = game_state.to_dict()
     
     # Verify it's JSON-serializable
-    json_str = json.dumps(state_dict)
-    assert isinstance(json_str, str)
+    json_bytes = orjson.dumps(state_dict)
+    assert isinstance(json_bytes, bytes)
     
-    # Deserialize back
-    restored_state = GameState.from_dict(state_dict)
+    # Deserialize back from the decoded JSON
+    restored_state = GameState.from_dict(orjson.loads(json_bytes))
     
     # Verify all fields match
     assert restored_state.player_location == game_state.player_location
     assert restored_state.keys_collected == game_state.keys_collected
     assert len(restored_state.inventory) == len(game_state.inventory)
     assert len(restored_state.visited_locations) == len(game_state.visited_locations)
+    assert restored_state.game_started_at == game_state.game_started_at
+
+
+@given(
+    st.lists(st.integers(min_value=1, max_value=6), unique=True, max_size=6),
+    st.integers(min_value=0, max_value=3)
+)
+@settings(max_examples=50)
+def test_game_state_delta_merge_matches_full_state(new_keys, new_locations):
+    """
+    Property: Merging a state delta into the client's previous state gives
+    the same state as sending the full game state.
+    """
+    from datetime import datetime
+    from backend.models.game_state import LocationData, Decision
+    
+    game_state = GameState.create_new_game()
+    before = game_state.to_dict()
+    known_location_ids = set(game_state.visited_locations)
+    decision_count = len(game_state.decision_history)
+    
+    # Simulate the effects of a command
+    game_state.keys_collected = new_keys
+    game_state.inventory.append(Item(id="lamp", name="Lamp", description="A lamp"))
+    for i in range(new_locations):
+        game_state.visited_locations[f"loc_{i}"] = LocationData(
+            id=f"loc_{i}", description="Somewhere", image_url="",
+            exits=["back"], items=[], npcs=[], generated_at=datetime.now()
+        )
+        game_state.player_location = f"loc_{i}"
+    if new_locations:
+        game_state.decision_history.append(Decision(
+            timestamp=datetime.now(), location_id="loc_0",
+            description="Went exploring", consequences=[]
+        ))
+    game_state.conversation_history = [{"role": "user", "content": [{"text": "go"}]}]
+    
+    delta = game_state.to_delta(known_location_ids, decision_count)
+    merged = {**before, **delta}
+    merged['visited_locations'] = {**before['visited_locations'], **delta['visited_locations']}
+    
+    assert merged == game_state.to_dict()
+    assert set(delta['visited_locations']) == {f"loc_{i}" for i in range(new_locations)}
+
+
+@given(
+    st.lists(st.integers(min_value=1, max_value=6), unique=True, max_size=6),
+    st.lists(st.text(max_size=20), max_size=5)
+)
+@settings(max_examples=50)
+def test_game_state_json_matches_to_dict(keys_collected, item_names):
+    """
+    Property: Encoding the GameState dataclass directly gives the same JSON
+    as encoding its to_dict() form.
+    """
+    from datetime import datetime
+    from backend.models.game_state import Interaction, PuzzleState, Decision
+    
+    game_state = GameState.create_new_game()
+    game_state.keys_collected = keys_collected
+    game_state.inventory = [
+        Item(id=f"item_{i}", name=name, description=name, properties={"n": i})
+        for i, name in enumerate(item_names)
+    ]
+    game_state.npc_interactions["owl"] = [Interaction(
+        timestamp=datetime.now(), npc_id="owl", player_action="talk",
+        npc_response="Hoo", sentiment="neutral"
+    )]
+    game_state.puzzle_states["riddle"] = PuzzleState(
+        puzzle_id="riddle", description="A riddle", solved=False,
+        attempts=["fire"], hints_given=1
+    )
+    game_state.decision_history.append(Decision(
+        timestamp=datetime.now(), location_id="forest_clearing",
+        description="Looked around", consequences=["Nothing happened"]
+    ))
+    
+    assert orjson.dumps(game_state) == orjson.dumps(game_state.to_dict())
+    assert GameState.from_json(game_state.to_json()).to_dict() == game_state.to_dict()
+
+
+@given(st.integers(min_value=0, max_value=5))
+@settings(max_examples=20)
+def test_lazy_locations_match_eager_parse(extra_locations):
+    """
+    Property: A state parsed with lazy locations serializes the same as an
+    eagerly parsed one, and only parses the locations that are read.
+    """
+    from datetime import datetime
+    from backend.models.game_state import LocationData, LazyLocationDict
+    
+    game_state = GameState.create_new_game()
+    for i in range(extra_locations):
+        game_state.visited_locations[f"loc_{i}"] = LocationData(
+            id=f"loc_{i}", description="Somewhere", image_url="",
+            exits=["back"], items=[Item(id="rock", name="Rock", description="A rock")],
+            npcs=[], generated_at=datetime.now()
+        )
+    data = orjson.loads(orjson.dumps(game_state))
+    
+    lazy_state = GameState.from_dict(data, lazy_locations=True)
+    assert isinstance(lazy_state.visited_locations, LazyLocationDict)
+    assert lazy_state.visited_locations["forest_clearing"].id == "forest_clearing"
+    parsed = [
+        loc_id for loc_id, value in lazy_state.visited_locations._data.items()
+        if isinstance(value, LocationData)
+    ]
+    assert parsed == ["forest_clearing"]
+    
+    assert lazy_state.to_dict() == GameState.from_dict(data).to_dict()
+    assert orjson.loads(lazy_state.to_json()) == data
+
+
+def test_lazy_locations_reject_missing_fields():
+    """Test that a lazily parsed state still rejects incomplete locations."""
+    data = orjson.loads(orjson.dumps(GameState.create_new_game()))
+    del data['visited_locations']['forest_clearing']['description']
+    
+    with pytest.raises(ValueError):
+        GameState.from_dict(data, lazy_locations=True)
+
+
+def test_from_dict_keeps_non_string_ids():
+    """Test that identifiers which are not plain strings are kept rather than interned."""
+    from backend.models.game_state import Decision, Interaction
+    
+    class Name(str):
+        pass
+    
+    interaction = Interaction.from_dict({
+        "timestamp": "2024-01-01T00:00:00", "npc_id": 7, "player_action": "talk",
+        "npc_response": "Hoo", "sentiment": Name("neutral")
+    })
+    decision = Decision.from_dict({
+        "timestamp": "2024-01-01T00:00:00", "location_id": None,
+        "description": "waited", "consequences": []
+    })
+    
+    assert interaction.npc_id == 7
+    assert interaction.sentiment == "neutral"
+    assert decision.location_id is None
+
+
+@given(st.lists(st.integers(min_value=0, max_value=5), max_size=20))
+@settings(max_examples=50)
+def test_npc_interactions_dump_tracks_appends(batch_sizes):
+    """
+    Property: Serializing NPC interactions between appends always matches
+    a fresh serialization of the full history.
+    """
+    from datetime import datetime
+    from backend.models.game_state import Interaction
+    
+    game_state = GameState.create_new_game()
+    history = game_state.npc_interactions.setdefault("owl", [])
+    for batch in batch_sizes:
+        history.extend(
+            Interaction(
+                timestamp=datetime.now(), npc_id="owl", player_action=f"talk {i}",
+                npc_response="Hoo", sentiment="neutral"
+            )
+            for i in range(batch)
+        )
+        assert game_state.to_dict()["npc_interactions"] == {
+            "owl": [interaction.to_dict() for interaction in history]
+        }
+    
+    # A replaced history is rebuilt rather than served from cache
+    game_state.npc_interactions["owl"] = history[::-1]
+    assert game_state.to_dict()["npc_interactions"]["owl"] == [
+        interaction.to_dict() for interaction in history[::-1]
+    ]
+
+
+def test_npc_interactions_dump_snapshot_unchanged_by_appends():
+    """Test that an earlier serialization does not change when interactions are appended."""
+    from datetime import datetime
+    from backend.models.game_state import Interaction
+    
+    def interaction(action):
+        return Interaction(
+            timestamp=datetime.now(), npc_id="owl", player_action=action,
+            npc_response="Hoo", sentiment="neutral"
+        )
+    
+    game_state = GameState.create_new_game()
+    game_state.npc_interactions["owl"] = [interaction("talk 0")]
+    snapshot = game_state.to_dict()
+    
+    game_state.npc_interactions["owl"].append(interaction("talk 1"))
+    assert len(game_state.to_dict()["npc_interactions"]["owl"]) == 2
+    assert len(snapshot["npc_interactions"]["owl"]) == 1
 
 
 # Property 9: Inventory view shows all items
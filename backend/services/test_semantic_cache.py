@@ -0,0 +1,204 @@
+"""
+Tests for local exit and NPC matching.
+
+Validates word-based exit and NPC matching, exact and normalized cache lookups,
+cached non-matches, eviction, and coalescing of concurrent model calls.
+"""
+
+import pytest
+
+from backend.services.semantic_cache import (
+    MatchCache,
+    MISS,
+    match_exit_locally,
+    match_npc_locally,
+    normalize_direction,
+    normalize_npc_target
+)
+
+
+EXITS = ["The Luminescent Bridge", "The Whispering Forest Path"]
+
+
+def test_normalize_direction_drops_filler():
+    """Test that movement verbs and articles are ignored."""
+    assert normalize_direction("Head towards the old bridge") == {"old", "bridge"}
+    assert normalize_direction("go north") == normalize_direction("north")
+    assert normalize_direction("climb up") != normalize_direction("climb down")
+    assert normalize_npc_target("with the old squirrel") == {"old", "squirrel"}
+
+
+def test_match_exit_locally():
+    """Test that clear word matches resolve without AI and ambiguity does not."""
+    assert match_exit_locally("cross the bridge", EXITS) == "The Luminescent Bridge"
+    assert match_exit_locally("whispering forrest", EXITS) == "The Whispering Forest Path"
+    assert match_exit_locally("go north", ["north", "south"]) == "north"
+    # Words split across both exits, or matching neither, are left to the AI
+    assert match_exit_locally("bridge path", EXITS) is None
+    assert match_exit_locally("the glowing crossing", EXITS) is None
+
+
+def test_match_npc_locally():
+    """Test that talk targets resolve to NPCs by their words."""
+    npcs = ["A peculiar squirrel with intelligent eyes", "Thumper the Wise Rabbit", "The Cabbage Patch Keeper"]
+    assert match_npc_locally("the squirrel", npcs) == npcs[0]
+    assert match_npc_locally("rabbit", npcs) == npcs[1]
+    assert match_npc_locally("keepr", npcs) == npcs[2]
+    assert match_npc_locally("the old owl", npcs) is None
+
+
+def test_exact_and_normalized_hits():
+    """Test that equivalent phrasings share a cached match."""
+    cache = MatchCache()
+    assert cache.get("bridge", EXITS) is MISS
+
+    cache.put("bridge", EXITS, "The Luminescent Bridge")
+
+    assert cache.get("BRIDGE", EXITS) == "The Luminescent Bridge"
+    assert cache.get("go to the bridge", EXITS) == "The Luminescent Bridge"
+    # Exit order does not matter, but the exit set does
+    assert cache.get("bridge", list(reversed(EXITS))) == "The Luminescent Bridge"
+    assert cache.get("bridge", EXITS[:1]) is MISS
+
+
+def test_cached_no_match():
+    """Test that a direction matching no exit is cached as None."""
+    cache = MatchCache()
+    cache.put("sideways", EXITS, None)
+
+    assert cache.get("sideways", EXITS) is None
+
+
+def test_eviction():
+    """Test that the least recently used entries are evicted."""
+    cache = MatchCache(maxsize=1)
+    cache.put("bridge", EXITS, "The Luminescent Bridge")
+    cache.put("path", EXITS, "The Whispering Forest Path")
+
+    assert cache.get("bridge", EXITS) is MISS
+    assert cache.get("path", EXITS) == "The Whispering Forest Path"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_equivalent_directions_share_one_model_call(monkeypatch):
+    """Test that equivalent directions awaiting the model are coalesced."""
+    import asyncio
+    from backend.models.game_state import GameState
+    from backend.services.action_handlers import ActionHandlers
+
+    calls = []
+
+    async def fake_ask(self, player_direction, available_exits):
+        calls.append(player_direction)
+        await asyncio.sleep(0.01)
+        return available_exits[0]
+
+    monkeypatch.setattr(ActionHandlers, "_ask_exit_match", fake_ask)
+    handlers = ActionHandlers(GameState.create_new_game())
+
+    results = await asyncio.gather(
+        handlers._match_exit_with_ai("glowing way", EXITS),
+        handlers._match_exit_with_ai("go the glowing way", EXITS),
+        handlers._match_exit_with_ai("shiny", EXITS),
+    )
+
+    assert results == [EXITS[0]] * 3
+    assert calls == ["glowing way", "shiny"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers(monkeypatch):
+    """Test that followers ask the model themselves if the leading call is cancelled."""
+    import asyncio
+    from backend.models.game_state import GameState
+    from backend.services.action_handlers import ActionHandlers
+
+    calls = []
+
+    async def fake_ask(self, player_direction, available_exits):
+        calls.append(player_direction)
+        await asyncio.sleep(0.01)
+        return available_exits[0]
+
+    monkeypatch.setattr(ActionHandlers, "_ask_exit_match", fake_ask)
+    handlers = ActionHandlers(GameState.create_new_game())
+
+    leader = asyncio.create_task(handlers._match_exit_with_ai("glimmering way", EXITS))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(handlers._match_exit_with_ai("go the glimmering way", EXITS))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == EXITS[0]
+    assert leader.cancelled()
+    assert calls == ["glimmering way", "go the glimmering way"]
+
+
+@pytest.mark.asyncio
+async def test_model_npc_match_is_numbered_and_cached(monkeypatch):
+    """Test that the model's NPC number maps to a name and is reused."""
+    import backend.services.action_handlers as action_handlers
+    from backend.models.game_state import GameState
+    from backend.services.semantic_cache import get_npc_match_cache
+
+    prompts = []
+
+    class FakeAgent:
+        def __init__(self, **kwargs):
+            pass
+
+        def __call__(self, prompt):
+            prompts.append(prompt)
+            return "2"
+
+    monkeypatch.setattr(action_handlers, "Agent", FakeAgent)
+    get_npc_match_cache().clear()
+    handlers = action_handlers.ActionHandlers(GameState.create_new_game())
+    npcs = ["Thumper the Wise Rabbit", "A peculiar squirrel with intelligent eyes"]
+
+    assert await handlers._match_npc_with_ai("the furry one", npcs) == npcs[1]
+    assert await handlers._match_npc_with_ai("The furry one", npcs) == npcs[1]
+    assert len(prompts) == 1
+    assert "2. A peculiar squirrel" in prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_talk_addresses_matched_npc(monkeypatch):
+    """Test that talk resolves the target to a listed NPC locally before the dialogue call."""
+    import backend.services.action_handlers as action_handlers
+    from backend.models.game_state import GameState
+
+    prompts = []
+
+    class FakeAgent:
+        def __init__(self, **kwargs):
+            pass
+
+        def __call__(self, prompt):
+            prompts.append(prompt)
+            return "Thumper twitches his nose."
+
+    monkeypatch.setattr(action_handlers, "Agent", FakeAgent)
+    action_handlers._NARRATION_CACHE.clear()
+    game_state = GameState.create_new_game()
+    game_state.visited_locations["forest_clearing"].npcs = [
+        "Thumper the Wise Rabbit", "The Cabbage Patch Keeper"
+    ]
+    handlers = action_handlers.ActionHandlers(game_state)
+
+    first = await handlers.handle_talk("rabbit")
+    second = await handlers.handle_talk("thumper")
+
+    assert first.message == second.message == "Thumper twitches his nose."
+    assert len(prompts) == 1
+    assert prompts[0].endswith("Player says: talk to Thumper the Wise Rabbit")
+
+    # Targets without a local match are used as written, with no matcher call
+    await handlers.handle_talk("the furry one")
+    assert len(prompts) == 2
+    assert prompts[1].endswith("Player says: talk to the furry one")
+    action_handlers._NARRATION_CACHE.clear()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -256,6 +256,22 @@ def test_delete_postcard():
     assert deleted_again is False
 
 
+def test_iter_shares_json_chunks_join_to_listing():
+    """Test that streamed share chunks reassemble into the full listing."""
+    import json
+
+    service = SharingService()
+    game_state = GameState.create_new_game()
+    postcards = [service.create_postcard(game_state) for _ in range(5)]
+
+    chunks = list(service.iter_shares_json(chunk_size=64))
+
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == {
+        postcard.share_code: json.loads(postcard.to_json()) for postcard in postcards
+    }
+
+
 def test_create_postcard_for_specific_location():
     """Test creating a postcard for a specific location (not current)."""
     service = SharingService()
@@ -0,0 +1,133 @@
+"""
+Tests for streamed narration.
+
+Validates that narrative handlers with stream_text=True relay the model's
+text as it arrives, fall back when the model fails before any text, stop
+the model call when the client goes away, and cache only responses that
+completed cleanly.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+import backend.services.action_handlers as action_handlers
+from backend.models.game_state import GameState
+from backend.services.action_handlers import ActionHandlers
+
+
+class FakeModel:
+    """
+    Stand-in for BedrockModel whose stream yields text deltas.
+    
+    Args:
+        chunks: Text chunks to stream
+        fail_after: Raise after this many chunks (None streams them all)
+        gate: If given, wait for it before every chunk after the first
+    """
+    
+    def __init__(self, chunks, fail_after=None, gate=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.gate = gate
+        self.closed = threading.Event()
+    
+    def format_request(self, messages, system_prompt=None):
+        return {"messages": messages, "system": system_prompt}
+    
+    def stream(self, request):
+        try:
+            for i, text in enumerate(self.chunks):
+                if i == self.fail_after:
+                    raise RuntimeError("stream dropped")
+                if self.gate is not None and i:
+                    self.gate.wait()
+                yield {"contentBlockDelta": {"delta": {"text": text}}}
+            if self.fail_after is not None and self.fail_after >= len(self.chunks):
+                raise RuntimeError("stream dropped")
+        finally:
+            self.closed.set()
+
+
+def use_model(monkeypatch, model):
+    """Make every Bedrock model lookup in the action handlers return model."""
+    monkeypatch.setattr(action_handlers, "get_bedrock_model", lambda *args, **kwargs: model)
+
+
+@pytest.fixture
+def handlers():
+    """Streaming handlers over a fresh game, with an empty narration cache."""
+    action_handlers._NARRATION_CACHE.clear()
+    yield ActionHandlers(GameState.create_new_game(), stream_text=True)
+    action_handlers._NARRATION_CACHE.clear()
+
+
+async def collect(result):
+    """Read all text from a result's message stream."""
+    assert result.message == ""
+    return [text async for text in result.message_stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_relays_chunks_and_caches_completion(handlers, monkeypatch):
+    """Test that chunks are relayed in order and a clean completion is cached."""
+    use_model(monkeypatch, FakeModel(["The owl ", "blinks slowly."]))
+
+    result = await handlers.handle_talk("owl")
+    assert await collect(result) == ["The owl ", "blinks slowly."]
+
+    cached = await handlers.handle_talk("owl")
+    assert cached.message_stream is None
+    assert cached.message == "The owl blinks slowly."
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_before_first_chunk(handlers, monkeypatch):
+    """Test that a failure before any text yields the fallback and is not cached."""
+    use_model(monkeypatch, FakeModel([], fail_after=0))
+
+    result = await handlers.handle_talk("owl")
+    assert await collect(result) == [
+        "You try to talk to owl, but they seem preoccupied at the moment."
+    ]
+
+    retried = await handlers.handle_talk("owl")
+    assert retried.message_stream is not None
+
+
+@pytest.mark.asyncio
+async def test_stream_failure_midway_keeps_text_without_caching(handlers, monkeypatch):
+    """Test that a failure after some text ends the stream and is not cached."""
+    use_model(monkeypatch, FakeModel(["The owl ", "blinks."], fail_after=1))
+
+    result = await handlers.handle_talk("owl")
+    assert await collect(result) == ["The owl "]
+
+    retried = await handlers.handle_talk("owl")
+    assert retried.message_stream is not None
+
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_stops_without_waiting(handlers, monkeypatch):
+    """Test that closing the stream returns at once and stops the model call."""
+    gate = threading.Event()
+    model = FakeModel(["The owl ", "blinks ", "slowly."], gate=gate)
+    use_model(monkeypatch, model)
+
+    result = await handlers.handle_talk("owl")
+    assert await anext(result.message_stream) == "The owl "
+
+    # The model thread is blocked on the gate; closing must not wait for it
+    await asyncio.wait_for(result.message_stream.aclose(), timeout=1)
+
+    gate.set()
+    assert await asyncio.to_thread(model.closed.wait, 1)
+
+    retried = await handlers.handle_talk("owl")
+    assert retried.message_stream is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""
+In-memory caching utilities for Nature42.
+
+Provides a small bounded cache whose entries can expire after a fixed
+time, for reusing AI responses while the game state they were produced
+for is unchanged and for remembering AI matches that never go stale.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded least-recently-used cache with per-entry expiry.
+
+    Entries expire ttl seconds after they were stored (never, if ttl is
+    None); when full, the least recently used entry is evicted. Not
+    thread-safe: use it from the event loop only.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = 60.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Seconds an entry stays valid after it is stored, or None
+                for entries that never expire
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Returned if the key is absent or expired
+
+        Returns:
+            The cached value, or default if absent or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, replacing any existing entry for the key.
+
+        Args:
+            key: Cache key
+            value: Value to cache (a stored None is only told apart from
+                a miss by passing a different default to get)
+        """
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -12,6 +12,7 @@ Implements Requirements 11.3, 11.4
 
 import asyncio
 import logging
+import random
 import time
 from typing import Optional, Callable, Any, TypeVar, Dict
 from functools import wraps
@@ -89,8 +90,6 @@ def calculate_backoff_delay(
     Returns:
         Delay in seconds
     """
-    import random
-    
     # Calculate exponential delay
     delay = min(
         config.initial_delay * (config.exponential_base ** attempt),
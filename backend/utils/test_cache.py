@@ -0,0 +1,71 @@
+"""
+Tests for caching utilities.
+
+This module tests expiry, eviction and non-expiring entries in the TTL cache.
+"""
+
+import pytest
+from backend.utils.cache import TTLCache
+
+
+def test_ttl_cache_get_and_put():
+    """Test storing, replacing and missing entries."""
+    cache = TTLCache(maxsize=4, ttl=60)
+    assert cache.get("hint") is None
+
+    cache.put("hint", "Look under the rock.")
+    assert cache.get("hint") == "Look under the rock."
+
+    cache.put("hint", "Ask the owl.")
+    assert cache.get("hint") == "Ask the owl."
+    assert len(cache) == 1
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    """Test that entries expire after the TTL."""
+    import backend.utils.cache as cache_module
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.put("hint", "Look under the rock.")
+
+    now[0] += 59
+    assert cache.get("hint") == "Look under the rock."
+
+    now[0] += 2
+    assert cache.get("hint") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+
+def test_ttl_cache_without_ttl_never_expires(monkeypatch):
+    """Test that ttl=None keeps entries and a default tells stored None from a miss."""
+    import backend.utils.cache as cache_module
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    missing = object()
+    cache = TTLCache(maxsize=4, ttl=None)
+    cache.put("north", None)
+
+    now[0] += 10 ** 9
+    assert cache.get("north", missing) is None
+    assert cache.get("south", missing) is missing
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
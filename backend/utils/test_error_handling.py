@@ -141,6 +141,43 @@ async def test_retry_with_backoff_failure():
     print("✓ Retry exhausts all attempts before failing")
 
 
+@pytest.mark.asyncio
+async def test_retry_with_backoff_does_not_block_event_loop(monkeypatch):
+    """Test async retries back off with asyncio.sleep, not time.sleep."""
+    import time
+
+    def blocking_sleep(_):
+        raise AssertionError("async retry must not call time.sleep")
+
+    monkeypatch.setattr(time, "sleep", blocking_sleep)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    @retry_with_backoff(
+        config=RetryConfig(max_attempts=2, initial_delay=0.1, jitter=False),
+        exceptions=(ValueError,)
+    )
+    async def always_fails():
+        raise ValueError("Always fails")
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        with pytest.raises(ValueError):
+            await always_fails()
+    finally:
+        ticker_task.cancel()
+
+    # Other coroutines kept running during the backoff delay
+    assert ticks >= 5
+    
+    print("✓ Async retry backoff yields to the event loop")
+
+
 def test_retry_sync_function():
     """Test retry logic with synchronous functions."""
     call_count = 0
@@ -318,6 +318,8 @@ class GameClient {
             // Update game state if provided
             if (result.game_state) {
                 await this.updateGameState(result.game_state);
+            } else if (result.state_delta) {
+                await this.applyStateDelta(result.state_delta);
             }
 
             // TODO: Display image if provided (Task 10.2)
@@ -368,6 +370,20 @@ class GameClient {
         await this.saveGame();
     }
 
+    /**
+     * Merge a partial game state from the server and trigger auto-save
+     * @param {object} delta - Changed fields; visited_locations holds only new locations
+     */
+    async applyStateDelta(delta) {
+        const { visited_locations: newLocations, ...fields } = delta;
+        const newState = { ...this.gameState, ...fields };
+        newState.visited_locations = {
+            ...(this.gameState.visited_locations || {}),
+            ...(newLocations || {})
+        };
+        await this.updateGameState(newState);
+    }
+
     /**
      * Clear saved game
      */
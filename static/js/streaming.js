@@ -86,6 +86,7 @@ class StreamingHandler {
         const reader = response.body.getReader();
         const decoder = new TextDecoder();
         let buffer = '';
+        let dataLines = [];
         let result = null;
 
         try {
@@ -107,8 +108,12 @@ class StreamingHandler {
                 buffer = lines.pop() || ''; // Keep incomplete line in buffer
 
                 for (const line of lines) {
+                    // An event may span several data lines; it ends at a blank line
                     if (line.startsWith('data: ')) {
-                        const data = this.parseSSEData(line.slice(6));
+                        dataLines.push(line.slice(6));
+                    } else if (line === '' && dataLines.length > 0) {
+                        const data = this.parseSSEData(dataLines.join('\n'));
+                        dataLines = [];
                         
                         if (data) {
                             if (data.type === 'text' && data.content) {
@@ -121,6 +126,10 @@ class StreamingHandler {
                                 // Store state changes
                                 if (!result) result = {};
                                 result.game_state = data.changes;
+                            } else if (data.type === 'state_delta' && data.changes) {
+                                // Store partial state to merge into the current state
+                                if (!result) result = {};
+                                result.state_delta = data.changes;
                             } else if (data.type === 'done') {
                                 // Stream complete
                                 if (!result) result = {};